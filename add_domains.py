@@ -2,13 +2,183 @@
 Utility script to add domains to the companies table for crawling.
 """
 
+import io
+import re
 import sys
 import logging
 from database import DatabaseManager
+from db_driver import PSYCOPG_VERSION
+
+if PSYCOPG_VERSION == 3:
+    from psycopg.errors import UniqueViolation
+else:
+    from psycopg2.errors import UniqueViolation
+    from psycopg2.extras import execute_values
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Protocol, www. prefix and trailing slashes to strip from input domains
+_NORMALIZE_RE = re.compile(r'^(?:https?://)?(?:www\.)?(.*?)/*$')
+
+
+def _execute_insert(cur, domains, on_conflict):
+    """
+    Insert domains in a single batched statement.
+
+    Args:
+        cur: Database cursor
+        domains: List of normalized domain names
+        on_conflict: Whether to skip existing domains with ON CONFLICT DO NOTHING
+
+    Returns:
+        List of (id, domain) tuples for newly inserted rows
+    """
+    conflict_clause = "ON CONFLICT (domain) DO NOTHING" if on_conflict else ""
+
+    if PSYCOPG_VERSION == 3:
+        # psycopg3 pipelines executemany() and keeps each statement's result
+        cur.executemany(f"""
+            INSERT INTO companies (domain, crawl_status, is_active)
+            VALUES (%s, 'pending', true)
+            {conflict_clause}
+            RETURNING id, domain
+        """, [(domain,) for domain in domains], returning=True)
+
+        inserted = []
+        while True:
+            inserted.extend(cur.fetchall())
+            if not cur.nextset():
+                break
+        return inserted
+
+    # psycopg2: expand into multi-row VALUES lists
+    return execute_values(cur, f"""
+        INSERT INTO companies (domain, crawl_status, is_active)
+        VALUES %s
+        {conflict_clause}
+        RETURNING id, domain
+    """, [(domain,) for domain in domains],
+        template="(%s, 'pending', true)", page_size=1000, fetch=True)
+
+
+def _insert_domains(cur, domains):
+    """
+    Insert domains, trying a plain INSERT before falling back to ON CONFLICT.
+
+    Duplicates are rare when adding domains, so the batch is first inserted
+    without a conflict check. On a unique violation the batch is rolled back
+    to a savepoint and split in half; only single rows use ON CONFLICT.
+
+    Args:
+        cur: Database cursor
+        domains: List of unique normalized domain names
+
+    Returns:
+        List of (id, domain) tuples for newly inserted rows
+    """
+    if not domains:
+        return []
+
+    cur.execute("SAVEPOINT add_domains_batch")
+    try:
+        inserted = _execute_insert(cur, domains, on_conflict=False)
+    except UniqueViolation:
+        cur.execute("ROLLBACK TO SAVEPOINT add_domains_batch")
+
+        if len(domains) == 1:
+            inserted = _execute_insert(cur, domains, on_conflict=True)
+        else:
+            mid = len(domains) // 2
+            inserted = (
+                _insert_domains(cur, domains[:mid]) +
+                _insert_domains(cur, domains[mid:])
+            )
+
+    cur.execute("RELEASE SAVEPOINT add_domains_batch")
+    return inserted
+
+
+def _normalize_domains(domains):
+    """
+    Normalize raw domain strings, skipping blanks.
+
+    Args:
+        domains: Iterable of raw domain strings
+
+    Yields:
+        Normalized domain names
+    """
+    for domain in domains:
+        # Strip protocol, www. prefix and trailing slashes in one pass; an
+        # embedded newline defeats the match and the value is dropped
+        m = _NORMALIZE_RE.match(domain.strip().lower())
+        domain = m.group(1) if m else ''
+        if domain:
+            yield domain
+
+
+class _DomainStream(io.TextIOBase):
+    """Read-only text stream of domains in COPY text format, one per line."""
+
+    def __init__(self, domains):
+        """
+        Initialize the stream.
+
+        Args:
+            domains: Iterable of normalized domain names
+        """
+        self._lines = (
+            domain.replace('\\', '\\\\').replace('\t', '\\t') + '\n'
+            for domain in domains
+        )
+        self._buffer = ''
+
+    def readable(self):
+        """Stream supports reading."""
+        return True
+
+    def read(self, size=-1):
+        """
+        Read up to size characters, pulling lines from the generator lazily.
+
+        Args:
+            size: Maximum number of characters (-1 = everything)
+
+        Returns:
+            Chunk of COPY data, empty string at end of stream
+        """
+        if size is None or size < 0:
+            chunk = self._buffer + ''.join(self._lines)
+            self._buffer = ''
+            return chunk
+
+        parts = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            parts.append(line)
+            length += len(line)
+            if length >= size:
+                break
+
+        data = ''.join(parts)
+        chunk, self._buffer = data[:size], data[size:]
+        return chunk
+
+
+def _log_inserted(inserted):
+    """
+    Log newly inserted domains as one DEBUG block instead of a line per row.
+
+    Args:
+        inserted: List of (id, domain) tuples
+    """
+    if inserted and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Added:\n%s",
+            "\n".join(f"{domain} (ID: {company_id})" for company_id, domain in inserted)
+        )
+
 
 def add_domains(domains):
     """
@@ -17,48 +187,95 @@ def add_domains(domains):
     Args:
         domains: List of domain names
     """
+    cleaned = list(_normalize_domains(domains))
+
+    if not cleaned:
+        logger.warning("No valid domains to add")
+        return
+
     db = DatabaseManager()
 
     try:
         with db.get_connection() as conn:
             with conn.cursor() as cur:
-                added = 0
-                skipped = 0
-
-                for domain in domains:
-                    domain = domain.strip()
-                    if not domain:
-                        continue
-
-                    # Remove protocol if present
-                    domain = domain.replace('https://', '').replace('http://', '')
-                    # Remove trailing slash
-                    domain = domain.rstrip('/')
-                    # Remove www. prefix
-                    if domain.startswith('www.'):
-                        domain = domain[4:]
-
-                    try:
-                        cur.execute("""
-                            INSERT INTO companies (domain, crawl_status, is_active)
-                            VALUES (%s, 'pending', true)
-                            ON CONFLICT (domain) DO NOTHING
-                            RETURNING id
-                        """, (domain,))
-
-                        result = cur.fetchone()
-                        if result:
-                            logger.info(f"Added domain: {domain} (ID: {result[0]})")
-                            added += 1
-                        else:
-                            logger.warning(f"Domain already exists: {domain}")
-                            skipped += 1
-
-                    except Exception as e:
-                        logger.error(f"Error adding domain {domain}: {e}")
-                        skipped += 1
-
-                logger.info(f"\nSummary: {added} domains added, {skipped} skipped")
+                # Drop repeats up front so they cannot force a batch split
+                inserted = _insert_domains(cur, list(dict.fromkeys(cleaned)))
+
+                _log_inserted(inserted)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    added_domains = {domain for _, domain in inserted}
+                    existing = [d for d in cleaned if d not in added_domains]
+                    if existing:
+                        logger.debug("Already existed:\n%s", "\n".join(existing))
+
+                added = len(inserted)
+                skipped = len(cleaned) - added
+
+                logger.info("Summary: %d domains added, %d skipped", added, skipped)
+
+    except Exception as e:
+        logger.error(f"Database error: {e}")
+        sys.exit(1)
+
+    finally:
+        db.close_pool()
+
+
+def add_domains_from_file(f):
+    """
+    Stream domains from a file into the companies table.
+
+    Normalized lines are copied into a temporary staging table with COPY and
+    inserted with a single set-based statement, so the file is never held in
+    memory.
+
+    Args:
+        f: Open text file with one domain per line
+    """
+    db = DatabaseManager()
+
+    try:
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TEMP TABLE _stage (domain TEXT) ON COMMIT DROP
+                """)
+
+                if PSYCOPG_VERSION == 3:
+                    with cur.copy("COPY _stage (domain) FROM STDIN") as copy:
+                        for domain in _normalize_domains(f):
+                            copy.write_row((domain,))
+                else:
+                    cur.copy_expert(
+                        "COPY _stage (domain) FROM STDIN",
+                        _DomainStream(_normalize_domains(f))
+                    )
+
+                cur.execute("SELECT COUNT(*) FROM _stage")
+                total = cur.fetchone()[0]
+
+                if not total:
+                    logger.warning("No valid domains to add")
+                    return
+
+                logger.info("Read %d domains from file", total)
+
+                cur.execute("""
+                    INSERT INTO companies (domain, crawl_status, is_active)
+                    SELECT DISTINCT domain, 'pending', true
+                    FROM _stage
+                    ON CONFLICT (domain) DO NOTHING
+                    RETURNING id, domain
+                """)
+                inserted = cur.fetchall()
+
+                _log_inserted(inserted)
+
+                added = len(inserted)
+                skipped = total - added
+
+                logger.info("Summary: %d domains added, %d skipped", added, skipped)
 
     except Exception as e:
         logger.error(f"Database error: {e}")
@@ -76,9 +293,7 @@ def main():
         print("  python add_domains.py -f domains.txt")
         sys.exit(1)
 
-    domains = []
-
-    # Read from file
+    # Stream from file
     if sys.argv[1] == '-f':
         if len(sys.argv) < 3:
             print("Error: Please specify a file path")
@@ -86,14 +301,14 @@ def main():
 
         try:
             with open(sys.argv[2], 'r') as f:
-                domains = [line.strip() for line in f if line.strip()]
-            logger.info(f"Read {len(domains)} domains from file")
+                add_domains_from_file(f)
         except FileNotFoundError:
             logger.error(f"File not found: {sys.argv[2]}")
             sys.exit(1)
-    else:
-        # Read from command line arguments
-        domains = sys.argv[1:]
+        return
+
+    # Read from command line arguments
+    domains = sys.argv[1:]
 
     if not domains:
         logger.error("No domains to add")
@@ -5,6 +5,53 @@ Utility script to check crawler status and view statistics.
 import sys
 from datetime import datetime
 from database import DatabaseManager
+from db_driver import PSYCOPG_VERSION
+
+RECENT_JOBS_SQL = """
+    SELECT
+        cj.job_id,
+        c.domain,
+        cj.status,
+        cj.pages_crawled,
+        cj.pages_failed,
+        cj.new_keywords_found,
+        cj.started_at,
+        cj.completed_at
+    FROM crawl_jobs cj
+    JOIN companies c ON c.id = cj.company_id
+    ORDER BY cj.created_at DESC
+    LIMIT %s
+"""
+
+TOP_KEYWORDS_SQL = """
+    SELECT
+        keyword,
+        normalized_keyword,
+        unique_domains_count,
+        total_occurrences
+    FROM keywords_master
+    ORDER BY unique_domains_count DESC, total_occurrences DESC
+    LIMIT %s
+"""
+
+FAILED_DOMAINS_SQL = """
+    SELECT domain, updated_at
+    FROM companies
+    WHERE crawl_status = 'failed'
+    ORDER BY updated_at DESC
+    LIMIT %s
+"""
+
+JOB_TEMPLATE = (
+    "\nJob ID: {}\n"
+    "  Domain:          {}\n"
+    "  Status:          {}\n"
+    "  Pages Crawled:   {}\n"
+    "  Pages Failed:    {}\n"
+    "  New Keywords:    {}\n"
+    "  Started:         {}\n"
+    "  Completed:       {}"
+)
 
 
 def format_timestamp(ts):
@@ -16,10 +63,48 @@ def format_timestamp(ts):
     return ts.strftime('%Y-%m-%d %H:%M:%S')
 
 
-def display_statistics(db):
-    """Display crawler statistics."""
-    stats = db.get_statistics()
+def fetch_reports(conn, queries):
+    """
+    Run several report queries over one connection in a single round-trip.
+
+    psycopg3 queues every query in pipeline mode before reading results.
+    psycopg2 has neither pipeline mode nor multiple result sets, so the
+    queries run back-to-back on the same connection instead.
+
+    Args:
+        conn: Open database connection
+        queries: Dict of {name: (sql, params)}
+
+    Returns:
+        Dict of {name: rows}
+    """
+    results = {}
+
+    if not queries:
+        return results
 
+    if PSYCOPG_VERSION == 3:
+        cursors = {}
+        with conn.pipeline():
+            for name, (query, params) in queries.items():
+                cur = conn.cursor()
+                cur.execute(query, params)
+                cursors[name] = cur
+
+        for name, cur in cursors.items():
+            results[name] = cur.fetchall()
+            cur.close()
+    else:
+        with conn.cursor() as cur:
+            for name, (query, params) in queries.items():
+                cur.execute(query, params)
+                results[name] = cur.fetchall()
+
+    return results
+
+
+def display_statistics(stats):
+    """Display crawler statistics."""
     print("\n" + "=" * 60)
     print("CRAWLER STATISTICS")
     print("=" * 60)
@@ -34,116 +119,85 @@ def display_statistics(db):
     print("=" * 60)
 
 
-def display_recent_jobs(db, limit=10):
+def display_recent_jobs(jobs, limit=10):
     """Display recent crawl jobs."""
-    print(f"\n{'=' * 60}")
-    print(f"RECENT CRAWL JOBS (Last {limit})")
-    print("=" * 60)
-
-    with db.get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT
-                    cj.job_id,
-                    c.domain,
-                    cj.status,
-                    cj.pages_crawled,
-                    cj.pages_failed,
-                    cj.new_keywords_found,
-                    cj.started_at,
-                    cj.completed_at
-                FROM crawl_jobs cj
-                JOIN companies c ON c.id = cj.company_id
-                ORDER BY cj.created_at DESC
-                LIMIT %s
-            """, (limit,))
-
-            jobs = cur.fetchall()
-
-            if not jobs:
-                print("No crawl jobs found")
-            else:
-                for job in jobs:
-                    print(f"\nJob ID: {job[0]}")
-                    print(f"  Domain:          {job[1]}")
-                    print(f"  Status:          {job[2]}")
-                    print(f"  Pages Crawled:   {job[3]}")
-                    print(f"  Pages Failed:    {job[4]}")
-                    print(f"  New Keywords:    {job[5]}")
-                    print(f"  Started:         {format_timestamp(job[6])}")
-                    print(f"  Completed:       {format_timestamp(job[7])}")
-
-    print("=" * 60)
-
-
-def display_top_keywords(db, limit=20):
+    lines = [
+        f"\n{'=' * 60}",
+        f"RECENT CRAWL JOBS (Last {limit})",
+        "=" * 60,
+    ]
+
+    if not jobs:
+        lines.append("No crawl jobs found")
+    else:
+        lines.extend(
+            JOB_TEMPLATE.format(
+                *job[:6],
+                format_timestamp(job[6]),
+                format_timestamp(job[7])
+            )
+            for job in jobs
+        )
+
+    lines.append("=" * 60)
+    print("\n".join(lines))
+
+
+def display_top_keywords(keywords, limit=20):
     """Display top keywords by domain count."""
-    print(f"\n{'=' * 60}")
-    print(f"TOP KEYWORDS (By Domain Count, Limit {limit})")
-    print("=" * 60)
+    lines = [
+        f"\n{'=' * 60}",
+        f"TOP KEYWORDS (By Domain Count, Limit {limit})",
+        "=" * 60,
+    ]
 
-    with db.get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT
-                    keyword,
-                    normalized_keyword,
-                    unique_domains_count,
-                    total_occurrences
-                FROM keywords_master
-                ORDER BY unique_domains_count DESC, total_occurrences DESC
-                LIMIT %s
-            """, (limit,))
-
-            keywords = cur.fetchall()
-
-            if not keywords:
-                print("No keywords found")
-            else:
-                print(f"\n{'Keyword':<30} {'Domains':<10} {'Total Uses':<12}")
-                print("-" * 60)
-                for kw in keywords:
-                    print(f"{kw[0]:<30} {kw[2]:<10} {kw[3]:<12}")
+    if not keywords:
+        lines.append("No keywords found")
+    else:
+        lines.append(f"\n{'Keyword':<30} {'Domains':<10} {'Total Uses':<12}")
+        lines.append("-" * 60)
+        lines.extend(f"{kw[0]:<30} {kw[2]:<10} {kw[3]:<12}" for kw in keywords)
 
-    print("=" * 60)
+    lines.append("=" * 60)
+    print("\n".join(lines))
 
 
-def display_failed_domains(db, limit=10):
+def display_failed_domains(domains, limit=10):
     """Display recently failed domains."""
-    print(f"\n{'=' * 60}")
-    print(f"RECENTLY FAILED DOMAINS (Last {limit})")
-    print("=" * 60)
-
-    with db.get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT domain, updated_at
-                FROM companies
-                WHERE crawl_status = 'failed'
-                ORDER BY updated_at DESC
-                LIMIT %s
-            """, (limit,))
-
-            domains = cur.fetchall()
-
-            if not domains:
-                print("No failed domains")
-            else:
-                print(f"\n{'Domain':<40} {'Failed At':<20}")
-                print("-" * 60)
-                for domain in domains:
-                    print(f"{domain[0]:<40} {format_timestamp(domain[1]):<20}")
-
-    print("=" * 60)
-
-
-def reset_stuck_jobs(db):
+    lines = [
+        f"\n{'=' * 60}",
+        f"RECENTLY FAILED DOMAINS (Last {limit})",
+        "=" * 60,
+    ]
+
+    if not domains:
+        lines.append("No failed domains")
+    else:
+        lines.append(f"\n{'Domain':<40} {'Failed At':<20}")
+        lines.append("-" * 60)
+        lines.extend(
+            f"{domain[0]:<40} {format_timestamp(domain[1]):<20}"
+            for domain in domains
+        )
+
+    lines.append("=" * 60)
+    print("\n".join(lines))
+
+
+def reset_stuck_jobs(db, conn):
     """Reset stuck jobs."""
     print("\nResetting stuck jobs...")
-    count = db.reset_stuck_jobs()
+    count = db.reset_stuck_jobs(conn)
     print(f"Reset {count} stuck jobs to pending status")
 
 
+def recount_keywords(db, conn):
+    """Recompute keyword statistics from domain_keywords."""
+    print("\nRecomputing keyword statistics...")
+    count = db.recompute_keyword_statistics(conn)
+    print(f"Corrected statistics for {count} keywords")
+
+
 def main():
     """Main entry point."""
     db = DatabaseManager()
@@ -157,22 +211,40 @@ def main():
         # Check command line arguments
         command = sys.argv[1] if len(sys.argv) > 1 else 'all'
 
-        if command == 'stats' or command == 'all':
-            display_statistics(db)
-
+        # Queue every requested report so they share one round-trip
+        queries = {}
         if command == 'jobs' or command == 'all':
-            display_recent_jobs(db)
+            queries['jobs'] = (RECENT_JOBS_SQL, (10,))
 
         if command == 'keywords' or command == 'all':
-            display_top_keywords(db)
+            queries['keywords'] = (TOP_KEYWORDS_SQL, (20,))
 
         if command == 'failed' or command == 'all':
-            display_failed_domains(db)
+            queries['failed'] = (FAILED_DOMAINS_SQL, (10,))
+
+        # Share a single pooled connection across every command
+        with db.get_connection() as conn:
+            if command == 'stats' or command == 'all':
+                display_statistics(db.get_statistics(conn))
+
+            reports = fetch_reports(conn, queries)
+
+            if 'jobs' in reports:
+                display_recent_jobs(reports['jobs'])
+
+            if 'keywords' in reports:
+                display_top_keywords(reports['keywords'])
+
+            if 'failed' in reports:
+                display_failed_domains(reports['failed'])
+
+            if command == 'reset':
+                reset_stuck_jobs(db, conn)
 
-        if command == 'reset':
-            reset_stuck_jobs(db)
+            if command == 'recount':
+                recount_keywords(db, conn)
 
-        if command not in ['stats', 'jobs', 'keywords', 'failed', 'reset', 'all']:
+        if command not in ['stats', 'jobs', 'keywords', 'failed', 'reset', 'recount', 'all']:
             print("Usage: python check_status.py [command]")
             print("\nCommands:")
             print("  stats     - Show crawler statistics")
@@ -180,6 +252,7 @@ def main():
             print("  keywords  - Show top keywords")
             print("  failed    - Show failed domains")
             print("  reset     - Reset stuck jobs")
+            print("  recount   - Recompute keyword statistics from domain_keywords")
             print("  all       - Show all information (default)")
 
     finally:
@@ -1,22 +1,20 @@
 """
 Cleanup script to reset database to a clean state.
 Run this if migrations left the database in a bad state.
+
+Usage:
+    python cleanup_db.py          # Prompt for confirmation
+    python cleanup_db.py --yes    # Skip the prompt
 """
 
 import sys
 
-# Try to import psycopg3 first, fall back to psycopg2
 try:
-    import psycopg
-    PSYCOPG_VERSION = 3
+    from db_driver import driver as psycopg, PSYCOPG_VERSION
 except ImportError:
-    try:
-        import psycopg2 as psycopg
-        PSYCOPG_VERSION = 2
-    except ImportError:
-        print("ERROR: Neither psycopg nor psycopg2 is installed.")
-        print("Please run: pip install -r requirements.txt")
-        sys.exit(1)
+    print("ERROR: Neither psycopg nor psycopg2 is installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
 
 from config import Config
 
@@ -28,20 +26,48 @@ print(f"Database: {Config.DB_NAME}@{Config.DB_HOST}")
 print("\nWARNING: This will drop all tables and the schema_migrations table!")
 print("=" * 70)
 
-response = input("\nDo you want to continue? (yes/no): ")
-if response.lower() not in ['yes', 'y']:
-    print("Cleanup cancelled.")
-    sys.exit(0)
+# Skip the confirmation prompt with -y/--yes for non-interactive runs
+if '-y' in sys.argv[1:] or '--yes' in sys.argv[1:]:
+    print("\nConfirmation skipped (--yes)")
+else:
+    response = input("\nDo you want to continue? (yes/no): ")
+    if response.lower() not in ['yes', 'y']:
+        print("Cleanup cancelled.")
+        sys.exit(0)
+
+# Drop tables in reverse order of dependencies
+TABLES = [
+    'crawl_jobs',
+    'domain_keywords',
+    'keywords_master',
+    'section_types',
+    'companies',
+    'schema_migrations'
+]
+
+VIEWS = [
+    'v_recent_crawl_jobs',
+    'v_top_keywords',
+    'v_crawl_statistics',
+    'v_pending_companies'
+]
+
+FUNCTIONS = ['update_updated_at_column()']
+
+# All DDL runs as one script in one transaction: a single round-trip and
+# commit, and nothing is dropped if any statement fails
+CLEANUP_SCRIPT = "\n".join([
+    "BEGIN;",
+    f"DROP TABLE IF EXISTS {', '.join(TABLES)} CASCADE;",
+    f"DROP VIEW IF EXISTS {', '.join(VIEWS)} CASCADE;",
+    f"DROP FUNCTION IF EXISTS {', '.join(FUNCTIONS)} CASCADE;",
+    "COMMIT;",
+])
 
 try:
-    # Connect to database
+    # Connect to database (autocommit, the script manages its own transaction)
     if PSYCOPG_VERSION == 3:
-        conninfo = (
-            f"host={Config.DB_HOST} port={Config.DB_PORT} "
-            f"dbname={Config.DB_NAME} user={Config.DB_USER} "
-            f"password={Config.DB_PASSWORD}"
-        )
-        conn = psycopg.connect(conninfo, autocommit=True)
+        conn = psycopg.connect(Config.DSN, autocommit=True)
     else:
         conn = psycopg.connect(
             host=Config.DB_HOST,
@@ -55,51 +81,51 @@ try:
     print("\nConnected to database successfully")
 
     with conn.cursor() as cur:
-        print("\nDropping existing tables...")
-
-        # Drop tables in reverse order of dependencies
-        tables = [
-            'crawl_jobs',
-            'domain_keywords',
-            'keywords_master',
-            'section_types',
-            'companies',
-            'schema_migrations'
-        ]
-
-        for table in tables:
-            try:
-                cur.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
-                print(f"  ✓ Dropped {table}")
-            except Exception as e:
-                print(f"  ⚠ Could not drop {table}: {e}")
-
-        # Drop views
-        views = [
-            'v_recent_crawl_jobs',
-            'v_top_keywords',
-            'v_crawl_statistics',
-            'v_pending_companies'
-        ]
-
-        print("\nDropping views...")
-        for view in views:
-            try:
-                cur.execute(f"DROP VIEW IF EXISTS {view} CASCADE")
-                print(f"  ✓ Dropped {view}")
-            except Exception as e:
-                print(f"  ⚠ Could not drop {view}: {e}")
-
-        # Drop functions
-        print("\nDropping functions...")
+        # Note which objects exist so the single script can still be reported per object
+        cur.execute("""
+            SELECT tablename FROM pg_tables
+            WHERE schemaname = current_schema() AND tablename = ANY(%s)
+            UNION ALL
+            SELECT viewname FROM pg_views
+            WHERE schemaname = current_schema() AND viewname = ANY(%s)
+            UNION ALL
+            SELECT p.proname || '(' || pg_get_function_identity_arguments(p.oid) || ')'
+            FROM pg_proc p
+            JOIN pg_namespace n ON n.oid = p.pronamespace
+            WHERE n.nspname = current_schema()
+              AND p.proname || '(' || pg_get_function_identity_arguments(p.oid) || ')' = ANY(%s)
+        """, (TABLES, VIEWS, FUNCTIONS))
+        existing = {row[0] for row in cur.fetchall()}
+
         try:
-            cur.execute("DROP FUNCTION IF EXISTS update_updated_at_column() CASCADE")
-            print("  ✓ Dropped update_updated_at_column()")
+            cur.execute(CLEANUP_SCRIPT)
         except Exception as e:
-            print(f"  ⚠ Could not drop function: {e}")
+            print(f"\n  ⚠ Cleanup rolled back, nothing was dropped: {e}")
+            raise
 
     conn.close()
 
+    print("\nDropped tables:")
+    for table in TABLES:
+        if table in existing:
+            print(f"  ✓ Dropped {table}")
+        else:
+            print(f"  - {table} did not exist")
+
+    print("\nDropped views:")
+    for view in VIEWS:
+        if view in existing:
+            print(f"  ✓ Dropped {view}")
+        else:
+            print(f"  - {view} did not exist")
+
+    print("\nDropped functions:")
+    for function in FUNCTIONS:
+        if function in existing:
+            print(f"  ✓ Dropped {function}")
+        else:
+            print(f"  - {function} did not exist")
+
     print("\n" + "=" * 70)
     print("DATABASE CLEANED SUCCESSFULLY")
     print("=" * 70)
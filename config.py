@@ -9,8 +9,18 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Number of CPUs, used to size the connection pool when not configured
+_CPU_COUNT = os.cpu_count() or 2
+
+
 class Config:
-    """Application configuration."""
+    """
+    Application configuration.
+
+    DB_MAX_CONN defaults to max(10, 2 * CPU count + 4) so the pool grows with
+    the host; DB_MIN_CONN stays small because the pool opens connections on
+    demand. Set either variable in the environment to override.
+    """
 
     # Database settings
     DB_HOST = os.getenv('DB_HOST', 'localhost')
@@ -19,7 +29,7 @@ class Config:
     DB_USER = os.getenv('DB_USER', 'postgres')
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
     DB_MIN_CONN = int(os.getenv('DB_MIN_CONN', 2))
-    DB_MAX_CONN = int(os.getenv('DB_MAX_CONN', 10))
+    DB_MAX_CONN = int(os.getenv('DB_MAX_CONN', max(10, 2 * _CPU_COUNT + 4)))
 
     # Crawler settings
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 30))
@@ -27,6 +37,11 @@ class Config:
     RATE_LIMIT_MAX = float(os.getenv('RATE_LIMIT_MAX', 2.0))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
     RETRY_DELAY = int(os.getenv('RETRY_DELAY', 5))
+    # Pages declaring a larger Content-Length are skipped; larger bodies
+    # without one are truncated at this size
+    MAX_PAGE_BYTES = int(os.getenv('MAX_PAGE_BYTES', 5 * 1024 * 1024))
+    # Hosts kept in the HTTP connection pool, and keep-alive connections per host
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 64))
 
     # User agent (default to Chrome on macOS to avoid bot detection)
     USER_AGENT = os.getenv(
@@ -48,19 +63,26 @@ class Config:
     # Processing settings
     BATCH_SIZE = int(os.getenv('BATCH_SIZE', 100))
     PROCESS_SEQUENTIAL = os.getenv('PROCESS_SEQUENTIAL', 'true').lower() == 'true'
+    # Domains crawled at once when PROCESS_SEQUENTIAL is false
+    CRAWL_WORKERS = int(os.getenv('CRAWL_WORKERS', 8))
+    # Service pages fetched at once for a single domain
+    SERVICE_CONCURRENCY = int(os.getenv('SERVICE_CONCURRENCY', 4))
 
     # Keyword filtering settings
     ENABLE_KEYWORD_FILTER = os.getenv('ENABLE_KEYWORD_FILTER', 'true').lower() == 'true'
     KEYWORD_EXCLUSIONS_FILE = os.getenv('KEYWORD_EXCLUSIONS_FILE', 'keyword_exclusions.yaml')
 
+    # PostgreSQL connection string, built once from the settings above
+    DSN = (
+        f"host={DB_HOST} port={DB_PORT} "
+        f"dbname={DB_NAME} user={DB_USER} "
+        f"password={DB_PASSWORD}"
+    )
+
     @classmethod
     def get_db_connection_string(cls):
         """Get PostgreSQL connection string."""
-        return (
-            f"host={cls.DB_HOST} port={cls.DB_PORT} "
-            f"dbname={cls.DB_NAME} user={cls.DB_USER} "
-            f"password={cls.DB_PASSWORD}"
-        )
+        return cls.DSN
 
     @classmethod
     def validate(cls):
@@ -2,12 +2,24 @@
 Main web crawler implementation.
 """
 
+import codecs
 import logging
+import re
 import requests
+import threading
 import time
-from typing import Optional, Dict, Set
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from typing import Optional, Dict, Set, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
 from requests.adapters import HTTPAdapter
+from requests.compat import chardet
 from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
 
 from config import Config
 from database import DatabaseManager
@@ -18,16 +30,77 @@ from service_extractor import (
     ServiceListingExtractor
 )
 from utils import (
-    RateLimiter,
+    PerHostRateLimiter,
     ProgressTracker,
     build_full_url,
     is_valid_url,
-    check_robots_txt,
-    sanitize_text
+    normalize_domain,
+    fetch_robots_parser,
+    sanitize_text,
+    parse_retry_after,
+    HTML_PARSER
 )
 
 logger = logging.getLogger(__name__)
 
+# Section types seeded by migrations; page_title and homepage_headers are optional
+REQUIRED_SECTION_TYPES = ('menu', 'service_detail', 'service_listing')
+
+# Finished crawls buffered before their job/company updates are written
+UPDATE_FLUSH_SIZE = 25
+
+# Longest a finished crawl waits in the buffer, in seconds; until its update
+# is written the domain stays in_progress and a crash would hand it out again
+UPDATE_FLUSH_INTERVAL = 5
+
+# Minimum seconds between database-wide statistics queries during a run
+STATS_LOG_INTERVAL = 30
+
+# Most hosts' parsed robots.txt kept at once; least recently used go first
+ROBOTS_CACHE_SIZE = 4096
+
+# Seconds a failed robots.txt fetch (error or 5xx) is trusted before retrying
+ROBOTS_RETRY_INTERVAL = 60
+
+# <meta charset="..."> or <meta http-equiv content="...; charset=..."> near the top
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+# Bytes fed to the statistical detector when nothing else settles the encoding
+DETECT_ENCODING_BYTES = 65536
+
+# Browser-like request headers (helps avoid bot detection), built once so
+# every session sends the same headers in the same order
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': Config.USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+})
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of one crawl step (menu, services or menu pages) for a domain."""
+
+    domain: str = ''
+    success: bool = False
+    keywords_found: int = 0
+    new_keywords: int = 0
+    pages_crawled: int = 0
+    pages_failed: int = 0
+    error: Optional[str] = None
+    service_links_found: int = 0
+    titles_found: int = 0
+    # (html, final_url, soup) from WebCrawler._fetch_homepage, shared between steps
+    homepage: Optional[Tuple[str, str, BeautifulSoup]] = field(default=None, repr=False)
+
 
 class WebCrawler:
     """Main web crawler for extracting navigation menus."""
@@ -41,12 +114,29 @@ class WebCrawler:
         """
         self.db = db_manager
         self.parser = MenuParser()
-        self.rate_limiter = RateLimiter(
+        self.rate_limiter = PerHostRateLimiter(
             Config.RATE_LIMIT_MIN,
             Config.RATE_LIMIT_MAX
         )
         self.session = self._create_session()
         self.should_stop = False
+        # Crawl outcomes waiting to be written by _flush_updates
+        self._pending_updates = []
+        # When _flush_updates last queried database statistics (monotonic)
+        self._last_stats_log = 0.0
+        # (parsed robots.txt or None when it could not be read, monotonic
+        # expiry or None when kept until evicted) per scheme://host
+        self._robots_cache: 'OrderedDict[str, Tuple[Optional[RobotFileParser], Optional[float]]]' = OrderedDict()
+        self._robots_lock = threading.Lock()
+
+        # Section types don't change during a run, so resolve them once
+        self._section_type_ids = self.db.get_section_type_ids()
+        missing = [code for code in REQUIRED_SECTION_TYPES if code not in self._section_type_ids]
+        if missing:
+            raise ValueError(
+                f"Section types not found in database: {', '.join(missing)} "
+                f"(run python migrate.py)"
+            )
 
     def _create_session(self) -> requests.Session:
         """
@@ -62,32 +152,74 @@ class WebCrawler:
             total=Config.MAX_RETRIES,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD"]
+            allowed_methods=["GET", "HEAD"],
+            # Hand the last throttled response back so its Retry-After can
+            # be applied to the host; raise_for_status() still rejects it
+            raise_on_status=False
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger pools so concurrent workers reuse keep-alive connections
+        # instead of opening and discarding extra ones per host; without
+        # blocking, a burst past the limit opens a one-off connection
+        adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_SIZE,
+            pool_maxsize=Config.HTTP_POOL_SIZE,
+            pool_block=False,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         # Set headers to mimic real browser (helps avoid bot detection)
-        session.headers.update({
-            'User-Agent': Config.USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        })
+        session.headers.update(DEFAULT_HEADERS)
 
         return session
 
-    def _extract_and_store_page_title(self, html_content: str, company_id: int, url: str) -> None:
+    def _is_allowed(self, url: str) -> bool:
+        """
+        Check robots.txt for a URL, reusing each host's parsed file while cached.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if allowed, False if disallowed
+        """
+        parsed = urlparse(url)
+        key = f"{parsed.scheme}://{parsed.netloc}"
+
+        now = time.monotonic()
+        with self._robots_lock:
+            entry = self._robots_cache.get(key)
+            cached = entry is not None and (entry[1] is None or entry[1] > now)
+            if cached:
+                self._robots_cache.move_to_end(key)
+                rp = entry[0]
+
+        if not cached:
+            # Fetch outside the lock so other hosts' checks are not held up
+            rp = fetch_robots_parser(
+                url, self.session, Config.REQUEST_TIMEOUT, verify=Config.VERIFY_SSL
+            )
+            # Errors and 5xx responses are only kept briefly, so one bad
+            # response does not decide the host for the rest of the run
+            expires = now + ROBOTS_RETRY_INTERVAL if rp is None or not rp.mtime() else None
+            with self._robots_lock:
+                self._robots_cache[key] = (rp, expires)
+                self._robots_cache.move_to_end(key)
+                if len(self._robots_cache) > ROBOTS_CACHE_SIZE:
+                    self._robots_cache.popitem(last=False)
+
+        # If we can't read robots.txt, allow crawling
+        return rp is None or rp.can_fetch(Config.USER_AGENT, url)
+
+    def _extract_and_store_page_title(
+        self,
+        html_content: str,
+        company_id: int,
+        url: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> None:
         """
         Extract and store page title from HTML content.
 
@@ -95,17 +227,18 @@ class WebCrawler:
             html_content: Raw HTML content
             company_id: Company ID
             url: Page URL where title was found
+            soup: Already parsed document for html_content, to skip re-parsing
         """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if soup is None:
+                soup = BeautifulSoup(html_content, HTML_PARSER)
 
             title_tag = soup.find('title')
             if title_tag:
                 title_text = sanitize_text(title_tag.get_text(strip=True))
 
                 if title_text and len(title_text) >= 3 and len(title_text) <= 200:
-                    section_type_id = self.db.get_section_type_id('page_title')
+                    section_type_id = self._section_type_ids.get('page_title')
                     if section_type_id:
                         # Store with source URL tracking
                         keywords_data = {
@@ -116,88 +249,153 @@ class WebCrawler:
                             keywords_data,
                             section_type_id
                         )
-                        logger.debug(f"Stored page title from {url}: {title_text[:50]}...")
+                        logger.debug("Stored page title from %s: %s...", url, title_text[:50])
         except Exception as e:
-            logger.debug(f"Error extracting page title from {url}: {e}")
+            logger.debug("Error extracting page title from %s: %s", url, e)
+
+    # Request failures in the order they must be matched: SSLError and the
+    # connect timeouts are also ConnectionErrors
+    _REQUEST_ERRORS = (
+        (requests.exceptions.Timeout, 'Request timeout'),
+        (requests.exceptions.SSLError, 'SSL error'),
+        (requests.exceptions.ConnectionError, 'Connection error'),
+        (requests.exceptions.RequestException, 'Request error'),
+    )
+
+    def _record_error(self, result: CrawlResult, exc: Exception, domain: str) -> bool:
+        """
+        Log a crawl failure and store its message in the result.
 
-    def crawl_domain(self, domain: str, company_id: int) -> Dict:
+        Args:
+            result: Crawl result to update
+            exc: Exception raised while crawling
+            domain: Domain being crawled
+
+        Returns:
+            True if the failure was an HTTP request error, False otherwise
+        """
+        for exc_cls, prefix in self._REQUEST_ERRORS:
+            if isinstance(exc, exc_cls):
+                if exc_cls is requests.exceptions.Timeout:
+                    error = f"{prefix} for {domain}"
+                else:
+                    error = f"{prefix} for {domain}: {str(exc)}"
+                logger.error(error)
+                result.error = error
+                return True
+
+        if isinstance(exc, ValueError):
+            error = str(exc)
+            logger.error(error)
+        else:
+            error = f"Unexpected error for {domain}: {str(exc)}"
+            logger.error(error, exc_info=True)
+
+        result.error = error
+        return False
+
+    def _fetch_homepage(self, domain: str) -> Tuple[str, str, BeautifulSoup]:
+        """
+        Fetch and parse a domain's homepage so every extractor can share it.
+
+        Args:
+            domain: Domain to fetch
+
+        Returns:
+            Tuple of (HTML content, final URL after redirects, parsed document)
+
+        Raises:
+            ValueError: If the URL is invalid, disallowed, or could not be fetched
+        """
+        # Build full URL
+        url = build_full_url(domain)
+
+        # Validate URL
+        if not is_valid_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+
+        # Check robots.txt if enabled
+        if Config.RESPECT_ROBOTS_TXT:
+            if not self._is_allowed(url):
+                raise ValueError(f"Crawling disallowed by robots.txt: {url}")
+
+        # Apply rate limiting
+        self.rate_limiter.wait(urlparse(url).netloc)
+
+        # Fetch homepage with final URL (handles redirects like example.com -> www.example.com)
+        logger.info("Fetching homepage: %s", url)
+        fetch_result = self._fetch_page_with_url(url)
+
+        if not fetch_result:
+            raise ValueError("Failed to fetch homepage content")
+
+        html_content, final_url = fetch_result
+
+        # Log if redirect occurred
+        if final_url != url:
+            logger.info("Redirect detected: %s -> %s", url, final_url)
+
+        return html_content, final_url, BeautifulSoup(html_content, HTML_PARSER)
+
+    def crawl_domain(
+        self,
+        domain: str,
+        company_id: int,
+        homepage: Optional[Tuple[str, str, BeautifulSoup]] = None
+    ) -> CrawlResult:
         """
         Crawl a single domain and extract menu items.
 
         Args:
             domain: Domain to crawl
             company_id: Company ID
+            homepage: Result of _fetch_homepage, fetched here when not given
 
         Returns:
-            Dictionary with crawl results
-        """
-        result = {
-            'success': False,
-            'domain': domain,
-            'keywords_found': 0,
-            'new_keywords': 0,
-            'error': None,
-            'pages_crawled': 0,
-            'pages_failed': 0
-        }
+            CrawlResult; its homepage field holds the fetched homepage (or None)
+            so later steps can reuse it
+        """
+        result = CrawlResult(domain=domain, homepage=homepage)
 
         try:
-            logger.info(f"Starting crawl for domain: {domain}")
-
-            # Build full URL
-            url = build_full_url(domain)
-
-            # Validate URL
-            if not is_valid_url(url):
-                raise ValueError(f"Invalid URL: {url}")
-
-            # Check robots.txt if enabled
-            if Config.RESPECT_ROBOTS_TXT:
-                if not check_robots_txt(url, Config.USER_AGENT):
-                    raise ValueError(f"Crawling disallowed by robots.txt: {url}")
+            logger.info("Starting crawl for domain: %s", domain)
 
-            # Apply rate limiting
-            self.rate_limiter.wait()
+            if homepage is None:
+                homepage = result.homepage = self._fetch_homepage(domain)
 
-            # Fetch the page
-            html_content = self._fetch_page(url)
+            html_content, url, soup = homepage
 
             if html_content:
                 # Extract keywords from menu
-                keywords = self.parser.extract_keywords(html_content)
+                keywords = self.parser.extract_keywords(html_content, soup=soup)
 
                 if keywords:
-                    # Get section type ID for 'menu'
-                    section_type_id = self.db.get_section_type_id('menu')
-
-                    if section_type_id:
-                        # Store keywords in database
-                        total, new = self.db.store_keywords_batch(
-                            company_id,
-                            list(keywords),
-                            section_type_id
-                        )
+                    # Store keywords in database
+                    total, new = self.db.store_keywords_batch(
+                        company_id,
+                        list(keywords),
+                        self._section_type_ids['menu']
+                    )
 
-                        result['keywords_found'] = total
-                        result['new_keywords'] = new
-                        result['pages_crawled'] = 1
-                        result['success'] = True
+                    result.keywords_found = total
+                    result.new_keywords = new
+                    result.pages_crawled = 1
+                    result.success = True
 
-                        logger.info(
-                            f"Successfully crawled {domain}: "
-                            f"{total} keywords ({new} new)"
-                        )
-                    else:
-                        raise ValueError("Section type 'menu' not found in database")
+                    logger.info(
+                        "Successfully crawled %s: "
+                        "%s keywords (%s new)",
+                        domain, total, new
+                    )
                 else:
-                    logger.warning(f"No menu keywords found for {domain}")
-                    result['success'] = True  # Still count as success
-                    result['pages_crawled'] = 1
+                    logger.warning("No menu keywords found for %s", domain)
+                    result.success = True  # Still count as success
+                    result.pages_crawled = 1
 
                 # Extract all header tags from homepage
-                homepage_headers = self.parser.extract_homepage_headers(html_content)
+                homepage_headers = self.parser.extract_homepage_headers(html_content, soup=soup)
                 if homepage_headers:
-                    section_type_id = self.db.get_section_type_id('homepage_headers')
+                    section_type_id = self._section_type_ids.get('homepage_headers')
                     if section_type_id:
                         # Convert to keywords_data format with source URL
                         keywords_data = {
@@ -209,270 +407,192 @@ class WebCrawler:
                             keywords_data,
                             section_type_id
                         )
-                        result['keywords_found'] += total_headers
-                        result['new_keywords'] += new_headers
+                        result.keywords_found += total_headers
+                        result.new_keywords += new_headers
                         logger.info(
-                            f"Extracted {total_headers} homepage headers ({new_headers} new)"
+                            "Extracted %s homepage headers (%s new)", total_headers, new_headers
                         )
 
                 # Extract page title from homepage
-                self._extract_and_store_page_title(html_content, company_id, url)
+                self._extract_and_store_page_title(html_content, company_id, url, soup=soup)
             else:
-                result['pages_failed'] = 1
+                result.pages_failed = 1
                 raise ValueError("Failed to fetch page content")
 
-        except requests.exceptions.Timeout:
-            error = f"Request timeout for {domain}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] = 1
-
-        except requests.exceptions.SSLError as e:
-            error = f"SSL error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] = 1
-
-        except requests.exceptions.ConnectionError as e:
-            error = f"Connection error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] = 1
-
-        except requests.exceptions.RequestException as e:
-            error = f"Request error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] = 1
-
-        except ValueError as e:
-            error = str(e)
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] = 1
-
         except Exception as e:
-            error = f"Unexpected error for {domain}: {str(e)}"
-            logger.error(error, exc_info=True)
-            result['error'] = error
-            result['pages_failed'] = 1
+            self._record_error(result, e, domain)
+            result.pages_failed = 1
 
         return result
 
-    def crawl_services(self, domain: str, company_id: int) -> Dict:
+    def crawl_services(
+        self,
+        domain: str,
+        company_id: int,
+        homepage: Optional[Tuple[str, str, BeautifulSoup]] = None
+    ) -> CrawlResult:
         """
         Crawl service pages by following navigation links.
 
         Args:
             domain: Domain to crawl
             company_id: Company ID
+            homepage: Result of _fetch_homepage, fetched here when not given
 
         Returns:
-            Dictionary with crawl results
-        """
-        result = {
-            'success': False,
-            'domain': domain,
-            'keywords_found': 0,
-            'new_keywords': 0,
-            'error': None,
-            'pages_crawled': 0,
-            'pages_failed': 0,
-            'service_links_found': 0
-        }
+            CrawlResult with service_links_found set
+        """
+        result = CrawlResult(domain=domain)
 
         try:
-            logger.info(f"Starting service extraction for domain: {domain}")
-
-            # Build full URL
-            url = build_full_url(domain)
-
-            # Validate URL
-            if not is_valid_url(url):
-                raise ValueError(f"Invalid URL: {url}")
-
-            # Check robots.txt if enabled
-            if Config.RESPECT_ROBOTS_TXT:
-                if not check_robots_txt(url, Config.USER_AGENT):
-                    raise ValueError(f"Crawling disallowed by robots.txt: {url}")
-
-            # Apply rate limiting
-            self.rate_limiter.wait()
+            logger.info("Starting service extraction for domain: %s", domain)
 
-            # Fetch homepage with final URL (handles redirects like example.com -> www.example.com)
-            logger.info(f"Fetching homepage: {url}")
-            fetch_result = self._fetch_page_with_url(url)
+            if homepage is None:
+                homepage = self._fetch_homepage(domain)
 
-            if not fetch_result:
-                raise ValueError("Failed to fetch homepage content")
-
-            html_content, final_url = fetch_result
-
-            # Log if redirect occurred
-            if final_url != url:
-                logger.info(f"Redirect detected: {url} -> {final_url}")
+            html_content, final_url, soup = homepage
 
             # Find service links from navigation using final URL (ensures same-domain check works after redirects)
-            service_links = NavigationLinkFollower.find_service_links(html_content, final_url, max_links=20)
-            result['service_links_found'] = len(service_links)
+            service_links = NavigationLinkFollower.find_service_links(
+                html_content, final_url, max_links=20, soup=soup
+            )
+            result.service_links_found = len(service_links)
 
             if not service_links:
-                logger.warning(f"No service links found for {domain}")
-                result['success'] = True  # Not an error, just no services found
+                logger.warning("No service links found for %s", domain)
+                result.success = True  # Not an error, just no services found
                 return result
 
-            logger.info(f"Found {len(service_links)} service links to crawl")
+            logger.info("Found %s service links to crawl", len(service_links))
 
             total_keywords = 0
             total_new = 0
 
-            # Process each service link
-            for idx, link_info in enumerate(service_links, 1):
-                service_url = link_info['url']
-                service_type = link_info['type']  # 'service_detail' or 'service_listing'
+            # Keywords from every page, stored per section type after the loop
+            buffered = {'service_detail': [], 'service_listing': []}
 
-                try:
-                    logger.info(f"Crawling service page {idx}/{len(service_links)}: {service_url}")
+            # Fetch service pages concurrently over the session's keep-alive
+            # pool and process each one as it arrives
+            workers = min(max(1, Config.SERVICE_CONCURRENCY), len(service_links))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._fetch_service_page, link_info['url']): link_info
+                    for link_info in service_links
+                }
 
-                    # Apply rate limiting between pages
-                    if idx > 1:
-                        self.rate_limiter.wait()
+                for idx, future in enumerate(as_completed(futures), 1):
+                    link_info = futures[future]
+                    service_url = link_info['url']
+                    service_type = link_info['type']  # 'service_detail' or 'service_listing'
 
-                    # Fetch service page
-                    service_html = self._fetch_page(service_url)
+                    try:
+                        service_html = future.result()
 
-                    if not service_html:
-                        logger.warning(f"Failed to fetch service page: {service_url}")
-                        result['pages_failed'] += 1
-                        continue
+                        if not service_html:
+                            logger.warning("Failed to fetch service page: %s", service_url)
+                            result.pages_failed += 1
+                            continue
 
-                    result['pages_crawled'] += 1
+                        logger.info("Crawled service page %s/%s: %s", idx, len(service_links), service_url)
+                        result.pages_crawled += 1
 
-                    # Extract page title from service page
-                    self._extract_and_store_page_title(service_html, company_id, service_url)
+                        # Extract page title from service page
+                        self._extract_and_store_page_title(service_html, company_id, service_url)
 
-                    # Extract keywords based on page type
-                    if service_type == 'service_detail':
-                        keywords_data = ServicePageExtractor.extract_keywords(service_html, service_url)
-                    else:  # service_listing
-                        keywords_data = ServiceListingExtractor.extract_keywords(service_html, service_url)
+                        # Extract keywords based on page type
+                        if service_type == 'service_detail':
+                            keywords_data = ServicePageExtractor.extract_keywords(service_html, service_url)
+                        else:  # service_listing
+                            keywords_data = ServiceListingExtractor.extract_keywords(service_html, service_url)
 
-                    if keywords_data:
-                        # Get section type ID
-                        section_type_id = self.db.get_section_type_id(service_type)
+                        if keywords_data:
+                            buffered[service_type].extend(keywords_data.items())
+                            logger.info("Extracted %s keywords from %s", len(keywords_data), service_url)
+                        else:
+                            logger.debug("No keywords extracted from %s", service_url)
 
-                        if not section_type_id:
-                            logger.error(f"Section type '{service_type}' not found in database")
-                            continue
+                    except Exception as e:
+                        logger.error("Error processing service page %s: %s", service_url, e)
+                        result.pages_failed += 1
+                        continue
 
-                        # Store keywords with source tracking
-                        total, new = self.db.store_keywords_with_source(
-                            company_id,
-                            keywords_data,
-                            section_type_id
-                        )
+            # Store keywords with source tracking, one transaction per section type
+            for service_type, keywords_data in buffered.items():
+                if not keywords_data:
+                    continue
 
-                        total_keywords += total
-                        total_new += new
+                total, new = self.db.store_keywords_with_source(
+                    company_id,
+                    keywords_data,
+                    self._section_type_ids[service_type]
+                )
 
-                        logger.info(
-                            f"Extracted {total} keywords ({new} new) from {service_url}"
-                        )
-                    else:
-                        logger.debug(f"No keywords extracted from {service_url}")
+                total_keywords += total
+                total_new += new
 
-                except Exception as e:
-                    logger.error(f"Error processing service page {service_url}: {e}")
-                    result['pages_failed'] += 1
-                    continue
+                logger.info("Stored %s %s keywords (%s new) for %s", total, service_type, new, domain)
 
             # Update final results
-            result['keywords_found'] = total_keywords
-            result['new_keywords'] = total_new
-            result['success'] = True
+            result.keywords_found = total_keywords
+            result.new_keywords = total_new
+            result.success = True
 
             logger.info(
-                f"Successfully crawled services for {domain}: "
-                f"{total_keywords} keywords ({total_new} new) from {result['pages_crawled']} pages"
+                "Successfully crawled services for %s: "
+                "%s keywords (%s new) from %s pages",
+                domain, total_keywords, total_new, result.pages_crawled
             )
 
-        except requests.exceptions.Timeout:
-            error = f"Request timeout for {domain}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except requests.exceptions.SSLError as e:
-            error = f"SSL error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except requests.exceptions.ConnectionError as e:
-            error = f"Connection error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except requests.exceptions.RequestException as e:
-            error = f"Request error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except ValueError as e:
-            error = str(e)
-            logger.error(error)
-            result['error'] = error
-
         except Exception as e:
-            error = f"Unexpected error for {domain}: {str(e)}"
-            logger.error(error, exc_info=True)
-            result['error'] = error
+            if self._record_error(result, e, domain):
+                result.pages_failed += 1
 
         return result
 
-    def crawl_menu_pages(self, domain: str, company_id: int) -> Dict:
+    def crawl_menu_pages(
+        self,
+        domain: str,
+        company_id: int,
+        homepage: Optional[Tuple[str, str, BeautifulSoup]] = None
+    ) -> CrawlResult:
         """
         Crawl all navigation menu pages and extract their titles.
 
         Args:
             domain: Domain to crawl
             company_id: Company ID
+            homepage: Result of _fetch_homepage, fetched here when not given
 
         Returns:
-            Dictionary with results
+            CrawlResult with titles_found set
         """
-        result = {
-            'success': False,
-            'pages_crawled': 0,
-            'pages_failed': 0,
-            'titles_found': 0,
-            'new_titles': 0,
-            'error': None
-        }
+        result = CrawlResult(domain=domain)
 
         try:
-            # Fetch homepage to extract menu links
-            url = f"https://{domain}"
-            page_data = self._fetch_page_with_url(url)
+            if homepage is not None:
+                html_content, final_url, soup = homepage
+            else:
+                # Fetch homepage to extract menu links
+                url = f"https://{domain}"
+                page_data = self._fetch_page_with_url(url)
 
-            if not page_data:
-                result['error'] = "Failed to fetch homepage for menu link extraction"
-                result['pages_failed'] = 1
-                return result
+                if not page_data:
+                    result.error = "Failed to fetch homepage for menu link extraction"
+                    result.pages_failed = 1
+                    return result
 
-            html_content, final_url = page_data
+                html_content, final_url = page_data
+                soup = None
 
             # Extract all menu links
-            menu_links = self.parser.extract_menu_links(html_content, final_url)
+            menu_links = self.parser.extract_menu_links(html_content, final_url, soup=soup)
 
             if not menu_links:
-                logger.info(f"No menu links found for {domain}")
-                result['success'] = True
+                logger.info("No menu links found for %s", domain)
+                result.success = True
                 return result
 
-            logger.info(f"Found {len(menu_links)} menu links to crawl for titles")
+            logger.info("Found %s menu links to crawl for titles", len(menu_links))
 
             # Crawl each menu page and extract title
             total_titles = 0
@@ -480,71 +600,43 @@ class WebCrawler:
 
             for menu_url in menu_links:
                 try:
-                    self.rate_limiter.wait()
+                    self.rate_limiter.wait(urlparse(menu_url).netloc)
 
-                    # Fetch the page
-                    page_data = self._fetch_page_with_url(menu_url)
+                    # Fetch the page; only its title is used, so stop reading
+                    # once the head's </title> has arrived
+                    page_data = self._fetch_page_with_url(menu_url, stop_after=b'</title>')
 
                     if not page_data:
-                        result['pages_failed'] += 1
+                        result.pages_failed += 1
                         continue
 
                     page_html, _ = page_data
-                    result['pages_crawled'] += 1
+                    result.pages_crawled += 1
 
                     # Extract and store page title
                     self._extract_and_store_page_title(page_html, company_id, menu_url)
                     total_titles += 1
 
-                    logger.debug(f"Crawled menu page {result['pages_crawled']}/{len(menu_links)}: {menu_url}")
+                    logger.debug("Crawled menu page %s/%s: %s", result.pages_crawled, len(menu_links), menu_url)
 
                 except Exception as e:
-                    logger.error(f"Error processing menu page {menu_url}: {e}")
-                    result['pages_failed'] += 1
+                    logger.error("Error processing menu page %s: %s", menu_url, e)
+                    result.pages_failed += 1
                     continue
 
             # Update final results
-            result['titles_found'] = total_titles
-            result['success'] = True
+            result.titles_found = total_titles
+            result.success = True
 
             logger.info(
-                f"Successfully crawled menu pages for {domain}: "
-                f"{total_titles} titles from {result['pages_crawled']} pages"
+                "Successfully crawled menu pages for %s: "
+                "%s titles from %s pages",
+                domain, total_titles, result.pages_crawled
             )
 
-        except requests.exceptions.Timeout:
-            error = f"Request timeout for {domain}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except requests.exceptions.SSLError as e:
-            error = f"SSL error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except requests.exceptions.ConnectionError as e:
-            error = f"Connection error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except requests.exceptions.RequestException as e:
-            error = f"Request error for {domain}: {str(e)}"
-            logger.error(error)
-            result['error'] = error
-            result['pages_failed'] += 1
-
-        except ValueError as e:
-            error = str(e)
-            logger.error(error)
-            result['error'] = error
-
         except Exception as e:
-            error = f"Unexpected error for {domain}: {str(e)}"
-            logger.error(error, exc_info=True)
-            result['error'] = error
+            if self._record_error(result, e, domain):
+                result.pages_failed += 1
 
         return result
 
@@ -561,54 +653,247 @@ class WebCrawler:
         result = self._fetch_page_with_url(url)
         return result[0] if result else None
 
-    def _fetch_page_with_url(self, url: str) -> Optional[tuple[str, str]]:
+    def _fetch_service_page(self, url: str) -> Optional[str]:
+        """
+        Rate-limit and fetch a service page; runs on a service pool thread.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content or None on failure
+        """
+        self.rate_limiter.wait(urlparse(url).netloc)
+        return self._fetch_page(url)
+
+    @staticmethod
+    def _detect_encoding(data: bytes) -> str:
+        """
+        Guess the character encoding of a page body without a declared charset.
+
+        Checks a <meta> charset near the top of the page, then whether the
+        body is valid UTF-8, and only then falls back to the statistical
+        detector behind requests' apparent_encoding (run on a prefix).
+
+        Args:
+            data: Raw (decompressed) page bytes
+
+        Returns:
+            Encoding name, 'utf-8' if it cannot be determined
+        """
+        match = META_CHARSET_RE.search(data, 0, META_CHARSET_SCAN_BYTES)
+        if match:
+            encoding = match.group(1).decode('ascii')
+        else:
+            try:
+                # Not final: a cut-off body may end mid-character
+                codecs.getincrementaldecoder('utf-8')().decode(data, final=False)
+                return 'utf-8'
+            except UnicodeDecodeError:
+                pass
+            if chardet is None:
+                return 'utf-8'
+            encoding = chardet.detect(bytes(data[:DETECT_ENCODING_BYTES]))['encoding'] or 'utf-8'
+
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            return 'utf-8'
+        return encoding
+
+    def _fetch_page_with_url(
+        self,
+        url: str,
+        stop_after: Optional[bytes] = None
+    ) -> Optional[tuple[str, str]]:
         """
         Fetch HTML content and final URL from URL (after redirects).
 
         Args:
             url: URL to fetch
+            stop_after: Lowercase closing tag (e.g. b'</title>'); when given, the
+                body is only read up to the chunk containing it
 
         Returns:
             Tuple of (HTML content, final URL after redirects) or None on failure
         """
         try:
-            logger.debug(f"Fetching {url}")
+            logger.debug("Fetching %s", url)
 
-            response = self.session.get(
+            # Stream the body so it is decompressed straight into one buffer
+            # and oversized pages are cut off instead of fully downloaded
+            with self.session.get(
                 url,
                 timeout=Config.REQUEST_TIMEOUT,
                 allow_redirects=Config.FOLLOW_REDIRECTS,
-                verify=Config.VERIFY_SSL
-            )
-
-            # Check status code
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get('Content-Type', '')
-            if 'text/html' not in content_type.lower():
-                logger.warning(f"Non-HTML content type: {content_type}")
-                return None
-
-            # Ensure proper encoding detection and decompression
-            # Access content first to trigger decompression
-            _ = response.content
+                verify=Config.VERIFY_SSL,
+                stream=True
+            ) as response:
+                # Throttled: make every worker back off from this host, not
+                # just the one whose request was retried
+                retry_after = response.headers.get('Retry-After')
+                if response.status_code in (429, 503) and retry_after:
+                    delay = parse_retry_after(retry_after)
+                    if delay:
+                        host = urlparse(response.url).netloc
+                        logger.warning(
+                            "%s throttled (HTTP %s), backing off %.0fs",
+                            host, response.status_code, delay
+                        )
+                        self.rate_limiter.defer(host, delay)
+
+                # Check status code
+                response.raise_for_status()
+
+                # Check content type
+                content_type = response.headers.get('Content-Type', '')
+                if 'text/html' not in content_type.lower():
+                    logger.warning("Non-HTML content type: %s", content_type)
+                    return None
+
+                # Skip bodies already known to be oversized without downloading them
+                content_length = response.headers.get('Content-Length', '')
+                if content_length.isdigit() and int(content_length) > Config.MAX_PAGE_BYTES:
+                    logger.warning(
+                        "Page larger than %s bytes (Content-Length %s), skipping: %s",
+                        Config.MAX_PAGE_BYTES, content_length, url
+                    )
+                    return None
+
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    # Search from just before the new chunk so a tag split
+                    # across two chunks is still found
+                    search_from = max(0, len(buf) - len(stop_after)) if stop_after else 0
+                    buf.extend(chunk)
+                    if stop_after and stop_after in bytes(buf[search_from:]).lower():
+                        break
+                    if len(buf) > Config.MAX_PAGE_BYTES:
+                        logger.warning(
+                            "Page larger than %s bytes, truncating: %s", Config.MAX_PAGE_BYTES, url
+                        )
+                        break
 
-            # Set encoding if not detected
-            if not response.encoding or response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding or 'utf-8'
+                # Use the declared charset unless it is missing or the HTTP default
+                encoding = response.encoding
+                if not encoding or encoding == 'ISO-8859-1':
+                    encoding = self._detect_encoding(buf)
 
-            # Return both HTML content and final URL (after any redirects)
-            return (response.text, response.url)
+                # Return both HTML content and final URL (after any redirects)
+                return (buf.decode(encoding, errors='replace'), response.url)
 
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching {url}: {e}")
+            logger.error("HTTP error fetching %s: %s", url, e)
             return None
 
         except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
+            logger.error("Error fetching %s: %s", url, e)
             return None
 
+    def _process_company(self, company: Dict) -> Dict:
+        """
+        Crawl one claimed company and describe the outcome.
+
+        Runs on a worker thread; the company was marked in_progress and given
+        a crawl job when it was claimed by get_next_pending_domains. The final
+        job and company status are left to run(), which writes them in batches.
+
+        Args:
+            company: Company row with 'id', 'domain' and 'job_id'
+
+        Returns:
+            Outcome dictionary in the shape expected by DatabaseManager.finish_crawls
+        """
+        company_id = company['id']
+        domain = company['domain']
+        outcome = {
+            'company_id': company_id,
+            'job_id': company['job_id'],
+            'status': 'failed',
+            'pages_crawled': 0,
+            'pages_failed': 0,
+            'new_keywords_found': 0,
+            'error_message': None,
+            'started_at': datetime.now(timezone.utc),
+            'finished_at': None
+        }
+
+        try:
+            # Step 1: Crawl navigation menu
+            logger.info("[%s] Extracting navigation menu keywords...", domain)
+            menu_result = self.crawl_domain(domain, company_id)
+
+            # Step 2: Crawl service pages, reusing the homepage from step 1
+            logger.info("[%s] Extracting service keywords...", domain)
+            service_result = self.crawl_services(domain, company_id, menu_result.homepage)
+
+            # Combine results
+            result = {
+                'success': menu_result.success and service_result.success,
+                'pages_crawled': menu_result.pages_crawled + service_result.pages_crawled,
+                'pages_failed': menu_result.pages_failed + service_result.pages_failed,
+                'new_keywords': menu_result.new_keywords + service_result.new_keywords,
+                'error': menu_result.error or service_result.error,
+                'menu_keywords': menu_result.keywords_found,
+                'service_keywords': service_result.keywords_found,
+                'service_links': service_result.service_links_found
+            }
+
+            logger.info(
+                "[%s] Complete - Menu: %s kw, "
+                "Services: %s kw (%s pages), "
+                "Total new: %s",
+                domain, result['menu_keywords'], result['service_keywords'],
+                result['service_links'], result['new_keywords']
+            )
+
+            outcome['pages_crawled'] = result['pages_crawled']
+            outcome['pages_failed'] = result['pages_failed']
+            if result['success']:
+                outcome['status'] = 'completed'
+                outcome['new_keywords_found'] = result['new_keywords']
+            else:
+                outcome['error_message'] = result['error']
+
+        except Exception as e:
+            logger.error("Error processing company %s: %s", company_id, e, exc_info=True)
+            outcome['error_message'] = str(e)
+
+        outcome['finished_at'] = datetime.now(timezone.utc)
+        return outcome
+
+    def _flush_updates(self, progress: ProgressTracker) -> None:
+        """
+        Write buffered crawl outcomes and log progress.
+
+        Database-wide statistics are only queried every STATS_LOG_INTERVAL
+        seconds; the local progress line is logged on every flush.
+
+        Args:
+            progress: Progress tracker for the current run
+        """
+        if not self._pending_updates:
+            return
+
+        self.db.finish_crawls(self._pending_updates)
+        self._pending_updates = []
+
+        logger.info(str(progress))
+
+        now = time.monotonic()
+        if now - self._last_stats_log < STATS_LOG_INTERVAL:
+            return
+        self._last_stats_log = now
+
+        stats = self.db.get_statistics()
+        logger.info(
+            "Stats - Pending: %s, "
+            "Completed: %s, "
+            "Failed: %s, "
+            "Total Keywords: %s",
+            stats['pending'], stats['completed'], stats['failed'], stats['total_keywords']
+        )
+
     def run(self) -> None:
         """Run the crawler to process pending domains."""
         logger.info("Starting web crawler")
@@ -618,7 +903,7 @@ class WebCrawler:
 
         # Get total pending count
         total_pending = self.db.get_pending_count()
-        logger.info(f"Found {total_pending} pending domains to crawl")
+        logger.info("Found %s pending domains to crawl", total_pending)
 
         if total_pending == 0:
             logger.info("No pending domains to crawl")
@@ -627,98 +912,96 @@ class WebCrawler:
         # Initialize progress tracker
         progress = ProgressTracker(total_pending)
 
-        # Process domains sequentially
-        processed = 0
-        while not self.should_stop:
-            # Get next pending domain
-            company = self.db.get_next_pending_domain()
-
-            if not company:
-                logger.info("No more pending domains")
-                break
-
-            company_id = company['id']
-            domain = company['domain']
-
-            try:
-                # Update status to in_progress
-                self.db.update_company_status(company_id, 'in_progress')
-
-                # Create crawl job
-                job_id = self.db.create_crawl_job(company_id)
-
-                # Step 1: Crawl navigation menu
-                logger.info(f"[{domain}] Extracting navigation menu keywords...")
-                menu_result = self.crawl_domain(domain, company_id)
-
-                # Step 2: Crawl service pages
-                logger.info(f"[{domain}] Extracting service keywords...")
-                service_result = self.crawl_services(domain, company_id)
-
-                # Combine results
-                result = {
-                    'success': menu_result['success'] and service_result['success'],
-                    'pages_crawled': menu_result['pages_crawled'] + service_result['pages_crawled'],
-                    'pages_failed': menu_result['pages_failed'] + service_result['pages_failed'],
-                    'new_keywords': menu_result['new_keywords'] + service_result['new_keywords'],
-                    'error': menu_result.get('error') or service_result.get('error'),
-                    'menu_keywords': menu_result['keywords_found'],
-                    'service_keywords': service_result['keywords_found'],
-                    'service_links': service_result.get('service_links_found', 0)
-                }
+        # Crawling is network-bound, so worker threads overlap page fetches
+        # while this thread claims domains and tracks progress
+        workers = 1 if Config.PROCESS_SEQUENTIAL else max(1, Config.CRAWL_WORKERS)
+        # Each worker holds a pooled connection while storing results and this
+        # thread needs one to claim domains; psycopg2's pool raises instead of
+        # waiting when it runs out, so never start more workers than it serves
+        max_workers = max(1, Config.DB_MAX_CONN - 1)
+        if workers > max_workers:
+            logger.warning(
+                "CRAWL_WORKERS=%s exceeds what DB_MAX_CONN=%s can serve; using %s worker(s)",
+                workers, Config.DB_MAX_CONN, max_workers
+            )
+            workers = max_workers
+        logger.info("Crawling with %s worker(s)", workers)
+
+        in_flight = set()
+        # Domains claimed (already in_progress) but not yet submitted
+        pending = deque()
+
+        buffered_since = 0.0
+
+        def collect(done) -> None:
+            nonlocal buffered_since
+            for future in done:
+                in_flight.discard(future)
+                outcome = future.result()
+                progress.update(success=outcome['status'] == 'completed')
+
+                if not self._pending_updates:
+                    buffered_since = time.monotonic()
+                self._pending_updates.append(outcome)
+
+            # Job and company updates are written in batches, but once one has
+            # waited UPDATE_FLUSH_INTERVAL the batch goes out at the next check
+            if self._pending_updates and (
+                len(self._pending_updates) >= UPDATE_FLUSH_SIZE
+                or time.monotonic() - buffered_since >= UPDATE_FLUSH_INTERVAL
+            ):
+                self._flush_updates(progress)
 
-                logger.info(
-                    f"[{domain}] Complete - Menu: {result['menu_keywords']} kw, "
-                    f"Services: {result['service_keywords']} kw ({result['service_links']} pages), "
-                    f"Total new: {result['new_keywords']}"
-                )
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while not self.should_stop:
+                    # Keep at most one claimed domain per worker
+                    # (waits time out so buffered updates are still written on time)
+                    if len(in_flight) >= workers:
+                        done, _ = wait(
+                            in_flight, timeout=UPDATE_FLUSH_INTERVAL, return_when=FIRST_COMPLETED
+                        )
+                        collect(done)
+                        continue
 
-                # Update job status
-                if result['success']:
-                    self.db.update_crawl_job(
-                        job_id,
-                        'completed',
-                        pages_crawled=result['pages_crawled'],
-                        pages_failed=result['pages_failed'],
-                        new_keywords_found=result['new_keywords']
-                    )
-                    self.db.update_company_status(company_id, 'completed')
-                    progress.update(success=True)
-                else:
-                    self.db.update_crawl_job(
-                        job_id,
-                        'failed',
-                        pages_crawled=result['pages_crawled'],
-                        pages_failed=result['pages_failed'],
-                        error_message=result['error']
+                    # Claim only as many domains as there are free workers, so
+                    # each starts as soon as it is claimed: claiming marks it
+                    # in_progress and starts its job, and a domain queued
+                    # locally for long could pass the stuck-job cutoff and be
+                    # reset and crawled again by another process
+                    if not pending:
+                        claim_size = min(Config.BATCH_SIZE, workers - len(in_flight))
+                        pending.extend(self.db.get_next_pending_domains(claim_size))
+
+                        if not pending:
+                            logger.info("No more pending domains")
+                            break
+
+                    in_flight.add(executor.submit(self._process_company, pending.popleft()))
+
+                # Let submitted domains finish even when stopping
+                while in_flight:
+                    done, _ = wait(
+                        in_flight, timeout=UPDATE_FLUSH_INTERVAL, return_when=FIRST_COMPLETED
                     )
-                    self.db.update_company_status(
-                        company_id,
-                        'failed',
-                        error_message=result['error']
-                    )
-                    progress.update(success=False)
-
-            except Exception as e:
-                logger.error(f"Error processing company {company_id}: {e}", exc_info=True)
-                self.db.update_company_status(
-                    company_id,
-                    'failed',
-                    error_message=str(e)
-                )
-                progress.update(success=False)
-
-            # Log progress
-            processed += 1
-            if processed % 10 == 0:
-                logger.info(str(progress))
-                stats = self.db.get_statistics()
-                logger.info(
-                    f"Stats - Pending: {stats['pending']}, "
-                    f"Completed: {stats['completed']}, "
-                    f"Failed: {stats['failed']}, "
-                    f"Total Keywords: {stats['total_keywords']}"
-                )
+                    collect(done)
+        finally:
+            try:
+                # If the loop failed, the executor has still let submitted
+                # domains finish; keep their outcomes
+                for future in in_flight:
+                    if not future.cancelled() and future.exception() is None:
+                        outcome = future.result()
+                        progress.update(success=outcome['status'] == 'completed')
+                        self._pending_updates.append(outcome)
+
+                # Write whatever is still buffered, even if the loop failed
+                self._flush_updates(progress)
+            finally:
+                # Hand back domains claimed but never started
+                if pending:
+                    logger.info("Releasing %s unstarted domains back to pending", len(pending))
+                    self.db.release_domains([company['id'] for company in pending])
 
         # Final progress report
         logger.info("Crawler finished")
@@ -726,10 +1009,12 @@ class WebCrawler:
 
         final_stats = self.db.get_statistics()
         logger.info(
-            f"Final Stats - Pending: {final_stats['pending']}, "
-            f"Completed: {final_stats['completed']}, "
-            f"Failed: {final_stats['failed']}, "
-            f"Total Keywords: {final_stats['total_keywords']}"
+            "Final Stats - Pending: %s, "
+            "Completed: %s, "
+            "Failed: %s, "
+            "Total Keywords: %s",
+            final_stats['pending'], final_stats['completed'],
+            final_stats['failed'], final_stats['total_keywords']
         )
 
     def crawl_single_domain(self, domain: str) -> bool:
@@ -742,28 +1027,26 @@ class WebCrawler:
         Returns:
             True if successful, False otherwise
         """
-        from utils import normalize_domain
-
-        logger.info(f"On-demand crawl requested for: {domain}")
+        logger.info("On-demand crawl requested for: %s", domain)
 
         # Normalize the domain
         normalized_domain = normalize_domain(domain)
-        logger.info(f"Normalized domain: {normalized_domain}")
+        logger.info("Normalized domain: %s", normalized_domain)
 
         # Check if domain exists in database
         company = self.db.get_company_by_domain(normalized_domain)
 
         if not company:
-            logger.error(f"Domain not found in database: {normalized_domain}")
+            logger.error("Domain not found in database: %s", normalized_domain)
             logger.error("Please add the domain first using add_domains.py or import_companies.py")
             return False
 
         company_id = company['id']
         current_status = company['crawl_status']
 
-        logger.info(f"Found company ID: {company_id}")
-        logger.info(f"Current status: {current_status}")
-        logger.info(f"Last crawled: {company.get('last_crawled', 'Never')}")
+        logger.info("Found company ID: %s", company_id)
+        logger.info("Current status: %s", current_status)
+        logger.info("Last crawled: %s", company.get('last_crawled', 'Never'))
 
         # Force crawl regardless of current status
         logger.info("Forcing crawl (bypassing status check)")
@@ -774,35 +1057,36 @@ class WebCrawler:
 
             # Create crawl job
             job_id = self.db.create_crawl_job(company_id)
-            logger.info(f"Created crawl job: {job_id}")
+            logger.info("Created crawl job: %s", job_id)
 
             # Step 1: Crawl navigation menu (section_type_id=1)
             logger.info("Step 1: Extracting navigation menu keywords...")
             menu_result = self.crawl_domain(normalized_domain, company_id)
 
-            # Step 2: Crawl service pages (section_type_id=5,6)
+            # Step 2: Crawl service pages (section_type_id=5,6), reusing the homepage from step 1
             logger.info("Step 2: Extracting service keywords from dedicated pages...")
-            service_result = self.crawl_services(normalized_domain, company_id)
+            homepage = menu_result.homepage
+            service_result = self.crawl_services(normalized_domain, company_id, homepage)
 
             # Step 3: Crawl all menu pages for titles (section_type_id=8)
             logger.info("Step 3: Extracting page titles from all menu pages...")
-            menu_pages_result = self.crawl_menu_pages(normalized_domain, company_id)
+            menu_pages_result = self.crawl_menu_pages(normalized_domain, company_id, homepage)
 
             # Combine results from all section types
             result = {
-                'success': menu_result['success'] and service_result['success'] and menu_pages_result['success'],
-                'menu_keywords': menu_result['keywords_found'],
-                'menu_new': menu_result['new_keywords'],
-                'service_keywords': service_result['keywords_found'],
-                'service_new': service_result['new_keywords'],
-                'service_links_found': service_result['service_links_found'],
-                'menu_titles_found': menu_pages_result['titles_found'],
-                'menu_pages_crawled': menu_pages_result['pages_crawled'],
-                'pages_crawled': menu_result['pages_crawled'] + service_result['pages_crawled'] + menu_pages_result['pages_crawled'],
-                'pages_failed': menu_result['pages_failed'] + service_result['pages_failed'] + menu_pages_result['pages_failed'],
-                'error': menu_result.get('error') or service_result.get('error') or menu_pages_result.get('error'),
-                'keywords_found': menu_result['keywords_found'] + service_result['keywords_found'],
-                'new_keywords': menu_result['new_keywords'] + service_result['new_keywords']
+                'success': menu_result.success and service_result.success and menu_pages_result.success,
+                'menu_keywords': menu_result.keywords_found,
+                'menu_new': menu_result.new_keywords,
+                'service_keywords': service_result.keywords_found,
+                'service_new': service_result.new_keywords,
+                'service_links_found': service_result.service_links_found,
+                'menu_titles_found': menu_pages_result.titles_found,
+                'menu_pages_crawled': menu_pages_result.pages_crawled,
+                'pages_crawled': menu_result.pages_crawled + service_result.pages_crawled + menu_pages_result.pages_crawled,
+                'pages_failed': menu_result.pages_failed + service_result.pages_failed + menu_pages_result.pages_failed,
+                'error': menu_result.error or service_result.error or menu_pages_result.error,
+                'keywords_found': menu_result.keywords_found + service_result.keywords_found,
+                'new_keywords': menu_result.new_keywords + service_result.new_keywords
             }
 
             # Update job and company status
@@ -817,32 +1101,35 @@ class WebCrawler:
                 self.db.update_company_status(company_id, 'completed')
 
                 # Print comprehensive summary
-                print("\n" + "=" * 70)
-                print("COMPLETE EXTRACTION RESULTS")
-                print("=" * 70)
-                print(f"Domain:              {normalized_domain}")
-                print(f"Status:              SUCCESS")
-                print()
-                print("Menu Extraction:")
-                print(f"  Keywords found:    {result['menu_keywords']}")
-                print(f"  New keywords:      {result['menu_new']}")
-                print()
-                print("Service Extraction:")
-                print(f"  Service links:     {result['service_links_found']}")
-                print(f"  Keywords found:    {result['service_keywords']}")
-                print(f"  New keywords:      {result['service_new']}")
-                print()
-                print("Menu Pages (Titles):")
-                print(f"  Pages crawled:     {result['menu_pages_crawled']}")
-                print(f"  Titles found:      {result['menu_titles_found']}")
-                print()
-                print("Total:")
-                print(f"  Keywords found:    {result['keywords_found']}")
-                print(f"  New keywords:      {result['new_keywords']}")
-                print(f"  Pages crawled:     {result['pages_crawled']}")
-                print(f"  Pages failed:      {result['pages_failed']}")
-                print(f"Job ID:              {job_id}")
-                print("=" * 70 + "\n")
+                print("\n".join([
+                    "",
+                    "=" * 70,
+                    "COMPLETE EXTRACTION RESULTS",
+                    "=" * 70,
+                    f"Domain:              {normalized_domain}",
+                    "Status:              SUCCESS",
+                    "",
+                    "Menu Extraction:",
+                    f"  Keywords found:    {result['menu_keywords']}",
+                    f"  New keywords:      {result['menu_new']}",
+                    "",
+                    "Service Extraction:",
+                    f"  Service links:     {result['service_links_found']}",
+                    f"  Keywords found:    {result['service_keywords']}",
+                    f"  New keywords:      {result['service_new']}",
+                    "",
+                    "Menu Pages (Titles):",
+                    f"  Pages crawled:     {result['menu_pages_crawled']}",
+                    f"  Titles found:      {result['menu_titles_found']}",
+                    "",
+                    "Total:",
+                    f"  Keywords found:    {result['keywords_found']}",
+                    f"  New keywords:      {result['new_keywords']}",
+                    f"  Pages crawled:     {result['pages_crawled']}",
+                    f"  Pages failed:      {result['pages_failed']}",
+                    f"Job ID:              {job_id}",
+                    "=" * 70 + "\n",
+                ]))
 
                 return True
             else:
@@ -860,19 +1147,22 @@ class WebCrawler:
                 )
 
                 # Print error summary
-                print("\n" + "=" * 70)
-                print("COMPLETE EXTRACTION RESULTS")
-                print("=" * 70)
-                print(f"Domain:          {normalized_domain}")
-                print(f"Status:          FAILED")
-                print(f"Error:           {result['error']}")
-                print(f"Job ID:          {job_id}")
-                print("=" * 70 + "\n")
+                print("\n".join([
+                    "",
+                    "=" * 70,
+                    "COMPLETE EXTRACTION RESULTS",
+                    "=" * 70,
+                    f"Domain:          {normalized_domain}",
+                    "Status:          FAILED",
+                    f"Error:           {result['error']}",
+                    f"Job ID:          {job_id}",
+                    "=" * 70 + "\n",
+                ]))
 
                 return False
 
         except Exception as e:
-            logger.error(f"Error during on-demand crawl: {e}", exc_info=True)
+            logger.error("Error during on-demand crawl: %s", e, exc_info=True)
             self.db.update_company_status(
                 company_id,
                 'failed',
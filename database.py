@@ -4,25 +4,31 @@ Database operations for the web crawler.
 
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple
-from contextlib import contextmanager
+from typing import Optional, List, Dict, Set, Tuple, Union
+from contextlib import contextmanager, nullcontext
 
-# Try to import psycopg3 first, fall back to psycopg2
-try:
-    import psycopg
+from db_driver import driver as psycopg, PSYCOPG_VERSION
+
+if PSYCOPG_VERSION == 3:
     from psycopg import sql
     from psycopg.rows import dict_row
     from psycopg_pool import ConnectionPool
-    PSYCOPG_VERSION = 3
-except ImportError:
-    import psycopg2 as psycopg
+
+    # Cursor options for queries that return rows as dictionaries
+    DICT_CURSOR_KWARGS = {'row_factory': dict_row}
+else:
     from psycopg2 import pool, extras, sql
-    PSYCOPG_VERSION = 2
+
+    DICT_CURSOR_KWARGS = {'cursor_factory': extras.RealDictCursor}
 
 from config import Config
+from utils import normalize_keyword
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row VALUES statement
+VALUES_PAGE_SIZE = 500
+
 
 class DatabaseManager:
     """Manages database connections and operations."""
@@ -37,13 +43,8 @@ class DatabaseManager:
         try:
             if PSYCOPG_VERSION == 3:
                 # psycopg3 connection pool
-                conninfo = (
-                    f"host={Config.DB_HOST} port={Config.DB_PORT} "
-                    f"dbname={Config.DB_NAME} user={Config.DB_USER} "
-                    f"password={Config.DB_PASSWORD}"
-                )
                 self.connection_pool = ConnectionPool(
-                    conninfo,
+                    Config.DSN,
                     min_size=Config.DB_MIN_CONN,
                     max_size=Config.DB_MAX_CONN
                 )
@@ -111,12 +112,7 @@ class DatabaseManager:
             Dictionary with company info or None
         """
         with self.get_connection() as conn:
-            if PSYCOPG_VERSION == 3:
-                cursor_kwargs = {'row_factory': dict_row}
-            else:
-                cursor_kwargs = {'cursor_factory': extras.RealDictCursor}
-
-            with conn.cursor(**cursor_kwargs) as cur:
+            with conn.cursor(**DICT_CURSOR_KWARGS) as cur:
                 cur.execute("""
                     SELECT id, domain, last_crawled, crawl_status
                     FROM companies
@@ -127,6 +123,76 @@ class DatabaseManager:
                 """)
                 return cur.fetchone()
 
+    def get_next_pending_domains(self, limit: int) -> List[Dict]:
+        """
+        Claim up to `limit` pending domains in one transaction.
+
+        The rows are locked with SKIP LOCKED and marked in_progress before the
+        transaction commits, so concurrent crawlers never claim the same domain.
+        A running crawl job is created for each claimed domain in the same
+        statement; finish_crawls records its real start time.
+
+        Args:
+            limit: Maximum number of domains to claim
+
+        Returns:
+            List of company dictionaries (including 'job_id'), oldest first
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(**DICT_CURSOR_KWARGS) as cur:
+                cur.execute("""
+                    WITH claimed AS (
+                        SELECT id, created_at
+                        FROM companies
+                        WHERE crawl_status = 'pending' AND is_active = true
+                        ORDER BY created_at ASC
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    ), updated AS (
+                        UPDATE companies c
+                        SET crawl_status = 'in_progress',
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM claimed
+                        WHERE c.id = claimed.id
+                        RETURNING c.id, c.domain, c.last_crawled, c.crawl_status, claimed.created_at
+                    ), jobs AS (
+                        INSERT INTO crawl_jobs (company_id, status, started_at)
+                        SELECT id, 'running', CURRENT_TIMESTAMP
+                        FROM updated
+                        RETURNING company_id, job_id
+                    )
+                    SELECT u.id, u.domain, u.last_crawled, u.crawl_status, j.job_id::text AS job_id
+                    FROM updated u
+                    JOIN jobs j ON j.company_id = u.id
+                    ORDER BY u.created_at ASC
+                """, (limit,))
+                return cur.fetchall()
+
+    def release_domains(self, company_ids: List[int]) -> None:
+        """
+        Return claimed but unprocessed domains to pending and cancel their jobs.
+
+        Args:
+            company_ids: Company IDs previously claimed by get_next_pending_domains
+        """
+        if not company_ids:
+            return
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE companies
+                    SET crawl_status = 'pending',
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ANY(%s) AND crawl_status = 'in_progress'
+                """, (list(company_ids),))
+                cur.execute("""
+                    UPDATE crawl_jobs
+                    SET status = 'cancelled',
+                        completed_at = CURRENT_TIMESTAMP
+                    WHERE company_id = ANY(%s) AND status = 'running'
+                """, (list(company_ids),))
+
     def get_company_by_domain(self, domain: str) -> Optional[Dict]:
         """
         Get company information by domain name.
@@ -138,12 +204,7 @@ class DatabaseManager:
             Dictionary with company info or None if not found
         """
         with self.get_connection() as conn:
-            if PSYCOPG_VERSION == 3:
-                cursor_kwargs = {'row_factory': dict_row}
-            else:
-                cursor_kwargs = {'cursor_factory': extras.RealDictCursor}
-
-            with conn.cursor(**cursor_kwargs) as cur:
+            with conn.cursor(**DICT_CURSOR_KWARGS) as cur:
                 cur.execute("""
                     SELECT id, domain, last_crawled, crawl_status, is_active
                     FROM companies
@@ -187,14 +248,17 @@ class DatabaseManager:
                 if error_message:
                     logger.error(f"Company {company_id} error: {error_message}")
 
-    def reset_stuck_jobs(self) -> int:
+    def reset_stuck_jobs(self, conn=None) -> int:
         """
         Reset companies stuck in 'in_progress' status.
 
+        Args:
+            conn: Optional open connection to reuse instead of taking one from the pool
+
         Returns:
             Number of companies reset
         """
-        with self.get_connection() as conn:
+        with (nullcontext(conn) if conn else self.get_connection()) as conn:
             with conn.cursor() as cur:
                 cur.execute("""
                     UPDATE companies
@@ -273,6 +337,74 @@ class DatabaseManager:
                         WHERE job_id = %s
                     """, (status, pages_crawled, pages_failed, new_keywords_found, job_id))
 
+    def finish_crawls(self, outcomes: List[Dict]) -> None:
+        """
+        Record the final job and company status for several crawls at once.
+
+        Args:
+            outcomes: List of dicts with company_id, job_id (may be None), status
+                ('completed' or 'failed'), pages_crawled, pages_failed,
+                new_keywords_found, error_message, started_at and finished_at
+        """
+        if not outcomes:
+            return
+
+        job_rows = [
+            (o['status'], o['started_at'], o['finished_at'], o['pages_crawled'], o['pages_failed'],
+             o['new_keywords_found'], o['error_message'], o['job_id'])
+            for o in outcomes if o['job_id']
+        ]
+        completed_rows = [
+            (o['finished_at'], o['finished_at'], o['company_id'])
+            for o in outcomes if o['status'] == 'completed'
+        ]
+        failed_rows = [
+            (o['status'], o['company_id'])
+            for o in outcomes if o['status'] != 'completed'
+        ]
+
+        statements = [
+            ("""
+                UPDATE crawl_jobs
+                SET status = %s,
+                    started_at = %s,
+                    completed_at = %s,
+                    pages_crawled = %s,
+                    pages_failed = %s,
+                    new_keywords_found = %s,
+                    error_message = %s
+                WHERE job_id = %s
+            """, job_rows),
+            ("""
+                UPDATE companies
+                SET crawl_status = 'completed',
+                    last_crawled = %s,
+                    next_crawl_date = %s + INTERVAL '30 days',
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+            """, completed_rows),
+            ("""
+                UPDATE companies
+                SET crawl_status = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+            """, failed_rows),
+        ]
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                for query, rows in statements:
+                    if not rows:
+                        continue
+                    if PSYCOPG_VERSION == 3:
+                        cur.executemany(query, rows)
+                    else:
+                        extras.execute_batch(cur, query, rows)
+
+        for o in outcomes:
+            if o['error_message']:
+                logger.error(f"Company {o['company_id']} error: {o['error_message']}")
+
     # Section type operations
 
     def get_section_type_id(self, code: str = 'menu') -> Optional[int]:
@@ -294,41 +426,87 @@ class DatabaseManager:
                 result = cur.fetchone()
                 return result[0] if result else None
 
+    def get_section_type_ids(self) -> Dict[str, int]:
+        """
+        Get all section type IDs keyed by code.
+
+        Returns:
+            Dictionary of {code: section type ID}
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT code, id FROM section_types")
+                return dict(cur.fetchall())
+
     # Keyword operations
 
-    def get_or_create_keyword(self, keyword: str, normalized: str) -> int:
+    def _execute_values(
+        self,
+        cur,
+        query: str,
+        rows: List[Tuple],
+        template: str,
+        fetch: bool = True
+    ) -> List[Tuple]:
         """
-        Get existing keyword ID or create new keyword.
+        Run a multi-row VALUES statement and return every RETURNING row.
 
         Args:
-            keyword: Original keyword
-            normalized: Normalized keyword
+            cur: Database cursor
+            query: SQL with a single ``{values}`` placeholder for the VALUES list
+            rows: Parameter tuples, one per VALUES row
+            template: Placeholder template for one row, e.g. ``(%s, %s)``
+            fetch: Whether the statement has a RETURNING clause to collect
 
         Returns:
-            Keyword ID
+            List of rows produced by the RETURNING clause (empty if not fetching)
         """
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                # Try to get existing keyword
-                cur.execute("""
-                    SELECT id FROM keywords_master
-                    WHERE normalized_keyword = %s
-                """, (normalized,))
-
-                result = cur.fetchone()
-                if result:
-                    return result[0]
+        if PSYCOPG_VERSION == 2:
+            return extras.execute_values(
+                cur, query.format(values='%s'), rows,
+                template=template, page_size=VALUES_PAGE_SIZE, fetch=fetch
+            ) or []
+
+        results = []
+        for start in range(0, len(rows), VALUES_PAGE_SIZE):
+            page = rows[start:start + VALUES_PAGE_SIZE]
+            values = ", ".join([template] * len(page))
+            cur.execute(query.format(values=values), [v for row in page for v in row])
+            if fetch:
+                results.extend(cur.fetchall())
+        return results
+
+    def _upsert_keywords(self, cur, pairs: List[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Insert or touch keywords in the master table in one statement.
 
-                # Create new keyword
-                cur.execute("""
-                    INSERT INTO keywords_master (keyword, normalized_keyword)
-                    VALUES (%s, %s)
-                    ON CONFLICT (normalized_keyword) DO UPDATE
-                    SET last_seen = CURRENT_TIMESTAMP
-                    RETURNING id
-                """, (keyword, normalized))
+        Args:
+            cur: Database cursor
+            pairs: List of (keyword, normalized keyword) tuples; keywords that
+                normalise to the same value are stored once
 
-                return cur.fetchone()[0]
+        Returns:
+            Dictionary of {normalized keyword: keyword ID}
+        """
+        rows = {}
+        for keyword, normalized in pairs:
+            if normalized not in rows:
+                rows[normalized] = (keyword, normalized)
+
+        if not rows:
+            return {}
+
+        # Sorted so concurrent workers lock shared keyword rows in the same
+        # order; the locks are held for the rest of the store transaction
+        returned = self._execute_values(cur, """
+            INSERT INTO keywords_master (keyword, normalized_keyword)
+            VALUES {values}
+            ON CONFLICT (normalized_keyword) DO UPDATE
+            SET last_seen = CURRENT_TIMESTAMP
+            RETURNING id, normalized_keyword
+        """, [rows[normalized] for normalized in sorted(rows)], "(%s, %s)")
+
+        return {normalized: keyword_id for keyword_id, normalized in returned}
 
     def store_keywords_batch(
         self,
@@ -350,58 +528,59 @@ class DatabaseManager:
         if not keywords:
             return 0, 0
 
-        new_keywords = 0
         total_keywords = len(keywords)
 
+        # Normalise each keyword once, dropping ones that normalise to nothing
+        normalized_pairs = [
+            (keyword, normalized)
+            for keyword, normalized in ((k, normalize_keyword(k)) for k in keywords)
+            if normalized
+        ]
+        if not normalized_pairs:
+            return total_keywords, 0
+
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                for keyword in keywords:
-                    from utils import normalize_keyword
-                    normalized = normalize_keyword(keyword)
-
-                    if not normalized:
-                        continue
-
-                    # Get or create keyword in master table
-                    keyword_id = self.get_or_create_keyword(keyword, normalized)
-
-                    # Check if this is a new keyword for this company
-                    cur.execute("""
-                        SELECT id FROM domain_keywords
-                        WHERE company_id = %s
-                        AND keyword_id = %s
-                        AND section_type_id = %s
-                    """, (company_id, keyword_id, section_type_id))
-
-                    if cur.fetchone():
-                        # Update existing record
-                        cur.execute("""
-                            UPDATE domain_keywords
-                            SET page_count = page_count + 1,
-                                total_frequency = total_frequency + 1,
-                                last_seen = CURRENT_TIMESTAMP
-                            WHERE company_id = %s
-                            AND keyword_id = %s
-                            AND section_type_id = %s
-                        """, (company_id, keyword_id, section_type_id))
-                    else:
-                        # Insert new record
-                        cur.execute("""
-                            INSERT INTO domain_keywords
-                            (company_id, keyword_id, section_type_id)
-                            VALUES (%s, %s, %s)
-                        """, (company_id, keyword_id, section_type_id))
-                        new_keywords += 1
+                keyword_ids = self._upsert_keywords(cur, normalized_pairs)
+
+                # A keyword listed more than once counts once per listing,
+                # but a single UPSERT may only touch each row once
+                counts = {}
+                for _, normalized in normalized_pairs:
+                    keyword_id = keyword_ids[normalized]
+                    counts[keyword_id] = counts.get(keyword_id, 0) + 1
+
+                known_ids = self._company_keyword_ids(cur, company_id, list(counts))
+
+                inserted = self._execute_values(cur, """
+                    INSERT INTO domain_keywords
+                    (company_id, keyword_id, section_type_id, page_count, total_frequency)
+                    VALUES {values}
+                    ON CONFLICT (company_id, keyword_id, section_type_id)
+                    DO UPDATE SET
+                        page_count = domain_keywords.page_count + EXCLUDED.page_count,
+                        total_frequency = domain_keywords.total_frequency + EXCLUDED.total_frequency,
+                        last_seen = CURRENT_TIMESTAMP
+                    RETURNING keyword_id, (xmax = 0) AS inserted
+                """, [
+                    (company_id, keyword_id, section_type_id, count, count)
+                    for keyword_id, count in counts.items()
+                ], "(%s, %s, %s, %s, %s)")
+
+                new_keywords = sum(1 for _, is_new in inserted if is_new)
 
                 # Update keyword statistics
-                self._update_keyword_statistics(cur, company_id)
+                self._update_keyword_statistics(cur, [
+                    (keyword_id, int(is_new and keyword_id not in known_ids), counts[keyword_id])
+                    for keyword_id, is_new in inserted
+                ])
 
         return total_keywords, new_keywords
 
     def store_keywords_with_source(
         self,
         company_id: int,
-        keywords_data: Dict[str, Dict],
+        keywords_data: Union[Dict[str, Dict], List[Tuple[str, Dict]]],
         section_type_id: int
     ) -> Tuple[int, int]:
         """
@@ -409,7 +588,9 @@ class DatabaseManager:
 
         Args:
             company_id: Company ID
-            keywords_data: Dict of {keyword: {'confidence': float, 'method': str, 'url': str}}
+            keywords_data: Dict of {keyword: {'confidence': float, 'method': str, 'url': str}},
+                or a list of (keyword, metadata) pairs gathered from several pages;
+                a keyword repeated across pages bumps its page_count each time
             section_type_id: Section type ID
 
         Returns:
@@ -418,82 +599,160 @@ class DatabaseManager:
         if not keywords_data:
             return 0, 0
 
-        new_keywords = 0
+        if isinstance(keywords_data, dict):
+            keywords_data = list(keywords_data.items())
+
         total_keywords = len(keywords_data)
 
+        # Normalise each keyword once, dropping ones that normalise to nothing
+        normalized_data = [
+            (keyword, normalized, metadata)
+            for keyword, normalized, metadata in (
+                (k, normalize_keyword(k), m) for k, m in keywords_data
+            )
+            if normalized
+        ]
+        if not normalized_data:
+            return total_keywords, 0
+
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                for keyword, metadata in keywords_data.items():
-                    from utils import normalize_keyword
-                    normalized = normalize_keyword(keyword)
-
-                    if not normalized:
-                        continue
-
-                    # Get or create keyword in master table
-                    keyword_id = self.get_or_create_keyword(keyword, normalized)
+                keyword_ids = self._upsert_keywords(
+                    cur, [(keyword, normalized) for keyword, normalized, _ in normalized_data]
+                )
 
-                    # Use UPSERT (INSERT ... ON CONFLICT DO UPDATE) to handle both new and existing keywords
-                    # This prevents duplicate key errors on re-crawls
-                    cur.execute("""
-                        INSERT INTO domain_keywords
-                        (company_id, keyword_id, section_type_id, source_url, extraction_method, confidence_score)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (company_id, keyword_id, section_type_id)
-                        DO UPDATE SET
-                            page_count = domain_keywords.page_count + 1,
-                            total_frequency = domain_keywords.total_frequency + 1,
-                            last_seen = CURRENT_TIMESTAMP,
-                            source_url = EXCLUDED.source_url,
-                            extraction_method = EXCLUDED.extraction_method,
-                            confidence_score = EXCLUDED.confidence_score
-                        RETURNING (xmax = 0) AS inserted
-                    """, (
+                # Fold repeats into one row per keyword: the count bumps
+                # page_count and the last page's metadata wins, as it would
+                # with one UPSERT per pair
+                rows = {}
+                for _, normalized, metadata in normalized_data:
+                    keyword_id = keyword_ids[normalized]
+                    count = rows[keyword_id][0] + 1 if keyword_id in rows else 1
+                    rows[keyword_id] = (count, metadata)
+
+                known_ids = self._company_keyword_ids(cur, company_id, list(rows))
+
+                # Use UPSERT (INSERT ... ON CONFLICT DO UPDATE) to handle both new and existing keywords
+                # This prevents duplicate key errors on re-crawls
+                inserted = self._execute_values(cur, """
+                    INSERT INTO domain_keywords
+                    (company_id, keyword_id, section_type_id, page_count, total_frequency,
+                     source_url, extraction_method, confidence_score)
+                    VALUES {values}
+                    ON CONFLICT (company_id, keyword_id, section_type_id)
+                    DO UPDATE SET
+                        page_count = domain_keywords.page_count + EXCLUDED.page_count,
+                        total_frequency = domain_keywords.total_frequency + EXCLUDED.total_frequency,
+                        last_seen = CURRENT_TIMESTAMP,
+                        source_url = EXCLUDED.source_url,
+                        extraction_method = EXCLUDED.extraction_method,
+                        confidence_score = EXCLUDED.confidence_score
+                    RETURNING keyword_id, (xmax = 0) AS inserted
+                """, [
+                    (
                         company_id,
                         keyword_id,
                         section_type_id,
+                        count,
+                        count,
                         metadata.get('url'),
                         metadata.get('method'),
                         metadata.get('confidence')
-                    ))
+                    )
+                    for keyword_id, (count, metadata) in rows.items()
+                ], "(%s, %s, %s, %s, %s, %s, %s, %s)")
 
-                    # Check if this was an insert (new keyword) or update (existing keyword)
-                    result = cur.fetchone()
-                    if result and result[0]:  # xmax = 0 means it was an INSERT
-                        new_keywords += 1
+                # xmax = 0 means the row was inserted rather than updated
+                new_keywords = sum(1 for _, is_new in inserted if is_new)
 
                 # Update keyword statistics
-                self._update_keyword_statistics(cur, company_id)
+                self._update_keyword_statistics(cur, [
+                    (keyword_id, int(is_new and keyword_id not in known_ids), rows[keyword_id][0])
+                    for keyword_id, is_new in inserted
+                ])
 
         return total_keywords, new_keywords
 
-    def _update_keyword_statistics(self, cur, company_id: int) -> None:
+    def _company_keyword_ids(self, cur, company_id: int, keyword_ids: List[int]) -> Set[int]:
         """
-        Update keyword master statistics.
+        Get which of the given keywords the company already has in any section.
 
         Args:
             cur: Database cursor
             company_id: Company ID
+            keyword_ids: Keyword IDs to check
+
+        Returns:
+            Set of keyword IDs already linked to the company
         """
         cur.execute("""
+            SELECT DISTINCT keyword_id
+            FROM domain_keywords
+            WHERE company_id = %s
+            AND keyword_id = ANY(%s)
+        """, (company_id, keyword_ids))
+        return {row[0] for row in cur.fetchall()}
+
+    def _update_keyword_statistics(self, cur, deltas: List[Tuple[int, int, int]]) -> None:
+        """
+        Apply incremental changes to keyword master statistics.
+
+        The counters only ever grow; deleted rows or a domain crawled twice
+        leave them drifting until recompute_keyword_statistics() is run.
+
+        Args:
+            cur: Database cursor
+            deltas: List of (keyword_id, new_domains, new_occurrences) tuples
+        """
+        if not deltas:
+            return
+
+        # No ordering needed here: _upsert_keywords already locked these rows
+        # earlier in the same transaction, in normalized keyword order
+        self._execute_values(cur, """
             UPDATE keywords_master km
-            SET unique_domains_count = (
-                    SELECT COUNT(DISTINCT company_id)
-                    FROM domain_keywords
-                    WHERE keyword_id = km.id
-                ),
-                total_occurrences = (
-                    SELECT COALESCE(SUM(total_frequency), 0)
-                    FROM domain_keywords
-                    WHERE keyword_id = km.id
-                ),
+            SET unique_domains_count = km.unique_domains_count + v.delta_domains,
+                total_occurrences = km.total_occurrences + v.delta_occurrences,
                 last_seen = CURRENT_TIMESTAMP
-            WHERE id IN (
-                SELECT keyword_id
-                FROM domain_keywords
-                WHERE company_id = %s
-            )
-        """, (company_id,))
+            FROM (VALUES {values}) AS v(keyword_id, delta_domains, delta_occurrences)
+            WHERE km.id = v.keyword_id
+        """, deltas, "(%s::bigint, %s::integer, %s::integer)", fetch=False)
+
+    def recompute_keyword_statistics(self, conn=None) -> int:
+        """
+        Recompute keyword master statistics from domain_keywords.
+
+        Corrects the drift the incremental updates can accumulate. Only rows
+        whose counters are wrong are rewritten; best run while no crawler is
+        storing keywords.
+
+        Args:
+            conn: Optional open connection to reuse instead of taking one from the pool
+
+        Returns:
+            Number of keywords corrected
+        """
+        with (nullcontext(conn) if conn else self.get_connection()) as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE keywords_master km
+                    SET unique_domains_count = s.domains,
+                        total_occurrences = s.occurrences
+                    FROM (
+                        SELECT k.id,
+                               COUNT(DISTINCT dk.company_id) AS domains,
+                               COALESCE(SUM(dk.total_frequency), 0) AS occurrences
+                        FROM keywords_master k
+                        LEFT JOIN domain_keywords dk ON dk.keyword_id = k.id
+                        GROUP BY k.id
+                    ) s
+                    WHERE km.id = s.id
+                    AND (km.unique_domains_count, km.total_occurrences)
+                        IS DISTINCT FROM (s.domains, s.occurrences)
+                """)
+                count = cur.rowcount
+                logger.info(f"Recomputed statistics for {count} keywords")
+                return count
 
     # Utility operations
 
@@ -513,15 +772,20 @@ class DatabaseManager:
                 """)
                 return cur.fetchone()[0]
 
-    def get_statistics(self) -> Dict:
+    def get_statistics(self, conn=None) -> Dict:
         """
         Get crawler statistics.
 
+        Args:
+            conn: Optional open connection to reuse instead of taking one from the pool
+
         Returns:
             Dictionary with statistics
         """
-        with self.get_connection() as conn:
+        with (nullcontext(conn) if conn else self.get_connection()) as conn:
             with conn.cursor() as cur:
+                # One round trip: company counts plus the keyword and job
+                # totals as scalar subqueries
                 cur.execute("""
                     SELECT
                         COUNT(*) FILTER (WHERE crawl_status = 'pending') as pending,
@@ -529,23 +793,15 @@ class DatabaseManager:
                         COUNT(*) FILTER (WHERE crawl_status = 'completed') as completed,
                         COUNT(*) FILTER (WHERE crawl_status = 'failed') as failed,
                         COUNT(*) FILTER (WHERE crawl_status = 'paused') as paused,
-                        COUNT(*) as total
+                        COUNT(*) as total,
+                        (SELECT COUNT(*) FROM keywords_master) as total_keywords,
+                        (SELECT COUNT(*) FROM crawl_jobs WHERE status = 'running') as active_jobs
                     FROM companies
                     WHERE is_active = true
                 """)
 
                 stats = cur.fetchone()
 
-                cur.execute("SELECT COUNT(*) FROM keywords_master")
-                total_keywords = cur.fetchone()[0]
-
-                cur.execute("""
-                    SELECT COUNT(*)
-                    FROM crawl_jobs
-                    WHERE status = 'running'
-                """)
-                active_jobs = cur.fetchone()[0]
-
                 return {
                     'pending': stats[0],
                     'in_progress': stats[1],
@@ -553,8 +809,8 @@ class DatabaseManager:
                     'failed': stats[3],
                     'paused': stats[4],
                     'total': stats[5],
-                    'total_keywords': total_keywords,
-                    'active_jobs': active_jobs
+                    'total_keywords': stats[6],
+                    'active_jobs': stats[7]
                 }
 
     def health_check(self) -> bool:
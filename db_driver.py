@@ -0,0 +1,12 @@
+"""
+PostgreSQL driver selection shared by every script.
+
+psycopg3 is preferred; psycopg2 is used when psycopg3 is not installed.
+"""
+
+try:
+    import psycopg as driver
+    PSYCOPG_VERSION = 3
+except ImportError:
+    import psycopg2 as driver
+    PSYCOPG_VERSION = 2
@@ -7,18 +7,31 @@ Usage:
     python import_companies.py -f domains.csv --update-existing --batch-size 500
 """
 
+import io
+import os
+import re
 import sys
 import csv
 import argparse
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 from datetime import datetime
 
+from config import Config
 from database import DatabaseManager
+from db_driver import PSYCOPG_VERSION
 from utils import normalize_domain
 
+if PSYCOPG_VERSION == 3:
+    from psycopg.errors import UniqueViolation
+else:
+    from psycopg2.errors import UniqueViolation
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +39,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bytes read from the CSV file per read call
+CSV_READ_BUFFER = 1 << 20
+
+# Characters sampled from the start of the file to detect a header row
+HEADER_SAMPLE_SIZE = 1024
+
+# Invalid rows kept for the summary; the rest are only counted
+MAX_INVALID_ENTRIES = 20
+
+# Seconds between import progress log lines
+PROGRESS_LOG_INTERVAL = 1.0
+
+# 4-253 letters, digits, dots and hyphens, not starting or ending with a dot
+# or hyphen ([^\W_] is str.isalnum(), so internationalised names still pass)
+_DOMAIN_RE = re.compile(r'(?![.-])(?:[^\W_]|[.-]){4,253}(?<![.-])')
+
+
+def _sniff_header(sample: str) -> bool:
+    """
+    Guess whether a CSV sample starts with a header row.
+
+    Args:
+        sample: Text from the start of the file
+
+    Returns:
+        True if header detected, False otherwise
+    """
+    try:
+        return csv.Sniffer().has_header(sample)
+    except Exception as e:
+        logger.warning(f"Could not detect header, assuming no header: {e}")
+        return False
+
+
+def _insert_companies(
+    cur,
+    domains: List[str],
+    update_existing: bool = False,
+    plain_first: bool = False
+) -> Tuple[int, int]:
+    """
+    Insert a batch of domains through a COPY-loaded staging table.
+
+    The batch is streamed into a temporary table with COPY and moved into
+    companies with one set-based INSERT ... SELECT, so the conflict check
+    runs once per batch rather than once per statement. Counts come from
+    cur.rowcount, so no RETURNING rows are built or sent back.
+
+    Args:
+        cur: Database cursor
+        domains: List of normalized domains (repeats are inserted once)
+        update_existing: Reset domains that already exist to pending before
+            inserting the new ones
+        plain_first: Try the INSERT without the conflict clause first, inside
+            a savepoint, and only rerun it with the clause on a unique
+            violation; worthwhile when existing domains are rare
+
+    Returns:
+        Tuple of (inserted_count, updated_count)
+    """
+    cur.execute("""
+        CREATE TEMP TABLE _import_stage (domain TEXT) ON COMMIT DROP
+    """)
+
+    if PSYCOPG_VERSION == 3:
+        with cur.copy("COPY _import_stage (domain) FROM STDIN") as copy:
+            for domain in domains:
+                copy.write_row((domain,))
+    else:
+        # Validated domains only hold letters, digits, dots and hyphens, so
+        # no COPY escaping is needed
+        cur.copy_expert(
+            "COPY _import_stage (domain) FROM STDIN",
+            io.StringIO(''.join(f"{domain}\n" for domain in domains))
+        )
+
+    updated = 0
+    if update_existing:
+        # Existing rows are updated first so the INSERT below only counts
+        # genuinely new domains
+        cur.execute("""
+            UPDATE companies c SET
+                crawl_status = 'pending',
+                is_active = true,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE c.domain IN (SELECT domain FROM _import_stage)
+        """)
+        updated = cur.rowcount
+
+    insert_sql = """
+        INSERT INTO companies (domain, crawl_status, is_active, created_at, updated_at)
+        SELECT DISTINCT s.domain, 'pending', true, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+        FROM _import_stage s
+        -- Existing domains are dropped by one anti-join over the batch, so
+        -- the conflict clause only has to settle concurrent inserts
+        WHERE NOT EXISTS (SELECT 1 FROM companies c WHERE c.domain = s.domain)
+        -- Same row order in every batch, so concurrent batches that share
+        -- domains lock them in the same order and cannot deadlock
+        ORDER BY s.domain
+        {conflict_clause}
+    """
+
+    if plain_first:
+        # The staged rows survive the rollback, so the retry resends nothing
+        cur.execute("SAVEPOINT import_batch")
+        try:
+            cur.execute(insert_sql.format(conflict_clause=''))
+            inserted = cur.rowcount
+            cur.execute("RELEASE SAVEPOINT import_batch")
+            return inserted, updated
+        except UniqueViolation:
+            cur.execute("ROLLBACK TO SAVEPOINT import_batch")
+
+    cur.execute(insert_sql.format(conflict_clause="ON CONFLICT (domain) DO NOTHING"))
+    return cur.rowcount, updated
+
 
 class CSVDomainImporter:
     """Import domains from CSV file into database."""
@@ -35,7 +164,8 @@ class CSVDomainImporter:
         db_manager: DatabaseManager,
         batch_size: int = 1000,
         update_existing: bool = False,
-        dry_run: bool = False
+        dry_run: bool = False,
+        workers: Optional[int] = None
     ):
         """
         Initialize CSV importer.
@@ -45,11 +175,17 @@ class CSVDomainImporter:
             batch_size: Number of domains to insert per batch
             update_existing: Whether to update existing domains
             dry_run: Preview mode without actual import
+            workers: Batches imported concurrently, each on its own pooled
+                connection (default: CPU count, at most 8)
         """
         self.db = db_manager
         self.batch_size = batch_size
         self.update_existing = update_existing
         self.dry_run = dry_run
+        # Never more workers than the connection pool can serve at once
+        if workers is None:
+            workers = min(8, os.cpu_count() or 1)
+        self.workers = max(1, min(workers, Config.DB_MAX_CONN))
 
         # Statistics
         self.stats = {
@@ -63,6 +199,9 @@ class CSVDomainImporter:
             'errors': 0
         }
 
+        # Guards stats updates made from import worker threads
+        self._stats_lock = threading.Lock()
+
         self.invalid_entries = []
         self.start_time = None
 
@@ -79,12 +218,11 @@ class CSVDomainImporter:
         """
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                sniffer = csv.Sniffer()
-                sample = f.read(1024)
-                return sniffer.has_header(sample)
+                sample = f.read(HEADER_SAMPLE_SIZE)
         except Exception as e:
             logger.warning(f"Could not detect header, assuming no header: {e}")
             return False
+        return _sniff_header(sample)
 
     def read_csv(
         self,
@@ -103,15 +241,35 @@ class CSVDomainImporter:
         Returns:
             List of raw domain strings
         """
-        domains = []
+        return list(self.iter_rows(file_path, has_header, column))
 
-        # Auto-detect header if not specified
-        if has_header is None:
-            has_header = self.detect_has_header(file_path)
-            logger.info(f"Auto-detected header: {has_header}")
+    def iter_rows(
+        self,
+        file_path: str,
+        has_header: Optional[bool] = None,
+        column: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield raw domains from CSV file one row at a time.
+
+        Args:
+            file_path: Path to CSV file
+            has_header: Whether CSV has header (None = auto-detect)
+            column: Column name or index (None = first column)
 
+        Yields:
+            Raw domain strings
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # newline='' as the csv module requires; a large buffer cuts read calls
+            with open(file_path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER) as f:
+                # Auto-detect header if not specified, sampling from the
+                # handle that is read below rather than opening the file twice
+                if has_header is None:
+                    has_header = _sniff_header(f.read(HEADER_SAMPLE_SIZE))
+                    f.seek(0)
+                    logger.info(f"Auto-detected header: {has_header}")
+
                 reader = csv.reader(f)
 
                 # Skip header if present
@@ -135,20 +293,21 @@ class CSVDomainImporter:
                     # Use first column or specified index
                     col_idx = int(column) if column and column.isdigit() else 0
 
-                # Read domains
-                for row_num, row in enumerate(reader, start=2 if has_header else 1):
-                    self.stats['total_rows'] += 1
-
-                    if not row:  # Skip empty rows
-                        continue
-
-                    if col_idx >= len(row):
-                        logger.warning(f"Row {row_num}: Column index {col_idx} out of range")
+                # Read domains; rows are counted once at the end
+                first_row = 2 if has_header else 1
+                row_num = first_row - 1
+                for row_num, row in enumerate(reader, start=first_row):
+                    try:
+                        domain = row[col_idx].strip()
+                    except IndexError:
+                        if row:  # Empty rows are skipped silently
+                            logger.warning(f"Row {row_num}: Column index {col_idx} out of range")
                         continue
 
-                    domain = row[col_idx].strip()
                     if domain:
-                        domains.append(domain)
+                        yield domain
+
+                self.stats['total_rows'] += row_num - first_row + 1
 
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
@@ -157,8 +316,6 @@ class CSVDomainImporter:
             logger.error(f"Error reading CSV file: {e}")
             raise
 
-        return domains
-
     def validate_domain(self, domain: str) -> Optional[str]:
         """
         Validate and normalize domain.
@@ -172,34 +329,22 @@ class CSVDomainImporter:
         if not domain or not domain.strip():
             return None
 
-        # Remove common prefixes
+        # Remove common prefixes by slicing rather than replace() passes
         domain = domain.strip().lower()
-        domain = domain.replace('http://', '')
-        domain = domain.replace('https://', '')
-        domain = domain.rstrip('/')
+        if domain.startswith('https://'):
+            domain = domain[8:]
+        elif domain.startswith('http://'):
+            domain = domain[7:]
+        if domain.endswith('/'):
+            domain = domain.rstrip('/')
 
         # Remove www. prefix
         if domain.startswith('www.'):
             domain = domain[4:]
 
-        # Basic validation
-        if not domain:
-            return None
-
-        # Check for valid characters
-        if not all(c.isalnum() or c in '.-' for c in domain):
-            return None
-
-        # Must contain at least one dot
-        if '.' not in domain:
-            return None
-
-        # Must not start or end with dot or hyphen
-        if domain.startswith(('.', '-')) or domain.endswith(('.', '-')):
-            return None
-
-        # Reasonable length check
-        if len(domain) < 4 or len(domain) > 253:
+        # Valid characters, no leading/trailing dot or hyphen, reasonable
+        # length, and at least one dot
+        if '.' not in domain or not _DOMAIN_RE.fullmatch(domain):
             return None
 
         return domain
@@ -212,27 +357,51 @@ class CSVDomainImporter:
             raw_domains: List of raw domain strings
 
         Returns:
-            List of valid, normalized domains
+            List of valid, normalized domains, each listed once
         """
-        valid_domains = []
+        return list(self.iter_valid_domains(raw_domains))
 
-        for idx, raw_domain in enumerate(raw_domains, start=1):
-            normalized = self.validate_domain(raw_domain)
+    def iter_valid_domains(self, raw_domains: Iterable[str]) -> Iterator[str]:
+        """
+        Validate and normalize domains as they are read.
 
-            if normalized:
-                valid_domains.append(normalized)
-                self.stats['valid_domains'] += 1
-            else:
-                self.stats['invalid_domains'] += 1
-                self.stats['skipped_invalid'] += 1
-                self.invalid_entries.append({
-                    'row': idx,
-                    'value': raw_domain,
-                    'reason': 'Invalid domain format'
-                })
-                logger.debug(f"Invalid domain at row {idx}: {raw_domain}")
+        Args:
+            raw_domains: Iterable of raw domain strings
 
-        return valid_domains
+        Yields:
+            Valid, normalized domains, each yielded once
+        """
+        validate = self.validate_domain
+        stats = self.stats
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Send each domain to the database once; repeats in the file are
+        # counted as duplicates here instead of hitting the conflict path
+        seen = set()
+
+        for idx, raw_domain in enumerate(raw_domains, start=1):
+            domain = validate(raw_domain)
+            if not domain:
+                stats['invalid_domains'] += 1
+                stats['skipped_invalid'] += 1
+                if len(self.invalid_entries) < MAX_INVALID_ENTRIES:
+                    self.invalid_entries.append({
+                        'row': idx,
+                        'value': raw_domain,
+                        'reason': 'Invalid domain format'
+                    })
+                if debug:
+                    logger.debug("Invalid domain at row %d: %s", idx, raw_domain)
+                continue
+
+            stats['valid_domains'] += 1
+            if domain in seen:
+                # Import workers update this counter too
+                with self._stats_lock:
+                    stats['skipped_duplicate'] += 1
+                continue
+
+            seen.add(domain)
+            yield domain
 
     def import_batch(self, domains: List[str]) -> Tuple[int, int]:
         """
@@ -244,81 +413,90 @@ class CSVDomainImporter:
         Returns:
             Tuple of (imported_count, updated_count)
         """
-        imported = 0
-        updated = 0
-
         if self.dry_run:
             logger.info(f"[DRY RUN] Would import {len(domains)} domains")
             return len(domains), 0
 
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cur:
-                for domain in domains:
-                    try:
-                        if self.update_existing:
-                            # Insert or update
-                            cur.execute("""
-                                INSERT INTO companies (domain, crawl_status, is_active, created_at, updated_at)
-                                VALUES (%s, 'pending', true, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                                ON CONFLICT (domain) DO UPDATE SET
-                                    crawl_status = 'pending',
-                                    is_active = true,
-                                    updated_at = CURRENT_TIMESTAMP
-                                RETURNING (xmax = 0) AS inserted
-                            """, (domain,))
-
-                            result = cur.fetchone()
-                            if result and result[0]:
-                                imported += 1
-                            else:
-                                updated += 1
-                        else:
-                            # Insert only, skip duplicates
-                            cur.execute("""
-                                INSERT INTO companies (domain, crawl_status, is_active, created_at, updated_at)
-                                VALUES (%s, 'pending', true, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                                ON CONFLICT (domain) DO NOTHING
-                                RETURNING id
-                            """, (domain,))
-
-                            result = cur.fetchone()
-                            if result:
-                                imported += 1
-                            else:
-                                self.stats['skipped_duplicate'] += 1
-
-                    except Exception as e:
-                        logger.error(f"Error importing domain {domain}: {e}")
-                        self.stats['errors'] += 1
-
-        return imported, updated
-
-    def import_domains(self, domains: List[str]) -> None:
-        """
-        Import domains in batches.
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # Insert only, skipping duplicates, unless existing
+                    # domains are to be reset as well
+                    imported, updated = _insert_companies(
+                        cur, domains,
+                        update_existing=self.update_existing,
+                        plain_first=not self.update_existing
+                    )
+        except Exception as e:
+            logger.error(f"Error importing batch of {len(domains)} domains: {e}")
+            with self._stats_lock:
+                self.stats['errors'] += len(domains)
+            return 0, 0
 
-        Args:
-            domains: List of validated domains
-        """
-        total = len(domains)
-        logger.info(f"Importing {total} domains in batches of {self.batch_size}")
+        if self.update_existing:
+            return imported, updated
 
-        for i in range(0, total, self.batch_size):
-            batch = domains[i:i + self.batch_size]
-            batch_num = (i // self.batch_size) + 1
-            total_batches = (total + self.batch_size - 1) // self.batch_size
+        with self._stats_lock:
+            self.stats['skipped_duplicate'] += len(domains) - imported
+        return imported, 0
 
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} domains)")
+    def import_domains(self, domains: Iterable[str]) -> int:
+        """
+        Import domains in batches.
 
-            imported, updated = self.import_batch(batch)
+        Domains are pulled from the iterable as batches are needed, so a
+        generator chain from the CSV reader is never held in memory whole.
 
-            self.stats['imported'] += imported
-            self.stats['updated'] += updated
+        Args:
+            domains: Iterable of validated domains
 
-            # Show progress
-            progress = min(i + self.batch_size, total)
-            pct = (progress / total * 100) if total > 0 else 0
-            logger.info(f"Progress: {progress}/{total} ({pct:.1f}%)")
+        Returns:
+            Number of domains sent to the database
+        """
+        logger.info(f"Importing in batches of {self.batch_size} ({self.workers} worker(s))")
+
+        # Batches are independent (ON CONFLICT settles overlaps), so several
+        # run at once on separate pooled connections. Only a couple of
+        # batches per worker are queued, so reading and validating the file
+        # overlaps with the inserts without running ahead of them.
+        max_pending = self.workers * 2
+        domains = iter(domains)
+        progress = 0
+        batch_num = 0
+        pending = {}
+        last_log = time.perf_counter()
+
+        def collect(done):
+            nonlocal progress, batch_num, last_log
+            for future in done:
+                imported, updated = future.result()
+                self.stats['imported'] += imported
+                self.stats['updated'] += updated
+                batch_num += 1
+                progress += pending.pop(future)
+
+            # Show progress, at most once per interval
+            now = time.perf_counter()
+            if now - last_log >= PROGRESS_LOG_INTERVAL:
+                last_log = now
+                logger.info("Batch %d done - Progress: %d domains", batch_num, progress)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                batch = list(islice(domains, self.batch_size))
+                if not batch:
+                    break
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(self.import_batch, batch)] = len(batch)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        logger.info("Imported %d batches - %d domains", batch_num, progress)
+        return progress
 
     def print_summary(self) -> None:
         """Print import summary report."""
@@ -343,7 +521,7 @@ class CSVDomainImporter:
             print(f"  Domains imported:         {self.stats['imported']}")
             if self.update_existing:
                 print(f"  Domains updated:          {self.stats['updated']}")
-            else:
+            if not self.update_existing or self.stats['skipped_duplicate']:
                 print(f"  Skipped (duplicates):     {self.stats['skipped_duplicate']}")
         print(f"  Skipped (invalid):        {self.stats['skipped_invalid']}")
         print(f"  Errors:                   {self.stats['errors']}")
@@ -354,13 +532,14 @@ class CSVDomainImporter:
             rate = self.stats['imported'] / elapsed
             print(f"  Import rate:              {rate:.1f} domains/second")
 
-        # Show invalid entries if any
-        if self.invalid_entries and len(self.invalid_entries) <= 20:
+        # Show invalid entries if any; only the first few are kept
+        if self.invalid_entries:
             print(f"\nInvalid Entries:")
-            for entry in self.invalid_entries[:20]:
+            for entry in self.invalid_entries:
                 print(f"  Row {entry['row']}: '{entry['value']}' - {entry['reason']}")
-            if len(self.invalid_entries) > 20:
-                print(f"  ... and {len(self.invalid_entries) - 20} more")
+            remaining = self.stats['invalid_domains'] - len(self.invalid_entries)
+            if remaining > 0:
+                print(f"  ... and {remaining} more")
 
         print("\n" + "=" * 70)
 
@@ -394,26 +573,22 @@ class CSVDomainImporter:
             logger.info(f"Update existing: {self.update_existing}")
             logger.info(f"Dry run: {self.dry_run}")
 
-            # Read CSV
-            raw_domains = self.read_csv(file_path, has_header, column)
-            logger.info(f"Read {len(raw_domains)} domain entries from CSV")
-
-            # Validate and normalize
+            # Read, validate and import as one stream
             logger.info("Validating and normalizing domains...")
-            valid_domains = self.process_domains(raw_domains)
-            logger.info(f"Found {len(valid_domains)} valid domains")
-
-            if not valid_domains:
-                logger.warning("No valid domains to import")
-                self.print_summary()
-                return False
+            valid_domains = self.iter_valid_domains(self.iter_rows(file_path, has_header, column))
 
-            # Import
             if self.dry_run:
                 logger.info("[DRY RUN MODE] - No actual import will occur")
-                logger.info(f"Would import {len(valid_domains)} domains")
+                unique_count = sum(1 for _ in valid_domains)
+                logger.info(f"Would import {unique_count} domains")
             else:
-                self.import_domains(valid_domains)
+                unique_count = self.import_domains(valid_domains)
+            logger.info(f"Found {unique_count} unique valid domains")
+
+            if not unique_count:
+                logger.warning("No valid domains to import")
+                self.print_summary()
+                return False
 
             # Print summary
             self.print_summary()
@@ -445,6 +620,9 @@ Examples:
   # Specify column and batch size
   python import_companies.py -f domains.csv --column domain --batch-size 500
 
+  # Import 4 batches concurrently
+  python import_companies.py -f domains.csv --workers 4
+
   # CSV with no header, use second column
   python import_companies.py -f domains.csv --no-header --column 1
         """
@@ -494,6 +672,13 @@ Examples:
         help='Number of domains per batch insert (default: 1000)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Batches to import concurrently (default: CPU count, at most 8)'
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -530,7 +715,8 @@ Examples:
         db_manager=db_manager,
         batch_size=args.batch_size,
         update_existing=args.update_existing,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        workers=args.workers
     )
 
     # Run import
@@ -6,13 +6,13 @@ import os
 import sys
 import signal
 import logging
+import threading
+import _thread
+import logging.handlers
 import argparse
-from datetime import datetime
 from pathlib import Path
 
 from config import Config
-from database import DatabaseManager
-from crawler import WebCrawler
 
 
 def setup_logging():
@@ -22,53 +22,75 @@ def setup_logging():
         log_dir = Path(Config.LOG_DIR)
         log_dir.mkdir(exist_ok=True)
 
-    # Configure root logger
-    logger = logging.getLogger()
-    logger.setLevel(getattr(logging, Config.LOG_LEVEL.upper()))
+    # Resolve the level once; unknown names fall back to INFO
+    level = getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO)
 
-    # Remove existing handlers
-    logger.handlers.clear()
-
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    handlers = []
 
     # Console handler
     if Config.LOG_TO_CONSOLE:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, Config.LOG_LEVEL.upper()))
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(logging.StreamHandler(sys.stdout))
 
-    # File handler (daily rotation)
+    # File handler (daily rotation at midnight, so long batch runs roll over
+    # too; the file is only opened once the first record is written)
     if Config.LOG_TO_FILE:
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_file = Path(Config.LOG_DIR) / f'crawler_{today}.log'
-
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(getattr(logging, Config.LOG_LEVEL.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_file = Path(Config.LOG_DIR) / 'crawler.log'
+        handlers.append(logging.handlers.TimedRotatingFileHandler(
+            log_file, when='midnight', encoding='utf-8', delay=True
+        ))
+
+    # Configure root logger; force swaps out any existing handlers in one
+    # step and every handler shares the same formatter
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=handlers,
+        force=True
+    )
 
-    return logger
+    return logging.getLogger()
 
 
-def signal_handler(signum, frame):
+def watch_shutdown_signals():
     """
-    Handle shutdown signals gracefully.
+    Route SIGINT and SIGTERM to a dedicated thread.
+
+    The signals are blocked in the calling thread, and so in every thread
+    started after it, and collected with signal.sigwait; shutdown then never
+    runs inside whatever frame the signal interrupted. Until a crawler is
+    registered a signal interrupts the main thread as Ctrl+C always has.
+    Where sigwait is unavailable a regular signal handler is installed.
 
-    Args:
-        signum: Signal number
-        frame: Current stack frame
+    Returns:
+        Function that registers the crawler to stop on a signal
     """
     logger = logging.getLogger(__name__)
-    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+    signals = {signal.SIGINT, signal.SIGTERM}
+    crawler_ref = []
+
+    def handle(signum):
+        if crawler_ref:
+            logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+            crawler_ref[0].stop()
+        else:
+            _thread.interrupt_main()
+
+    if hasattr(signal, 'pthread_sigmask') and hasattr(signal, 'sigwait'):
+        def wait_for_signals():
+            while True:
+                handle(signal.sigwait(signals))
+
+        signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+        threading.Thread(target=wait_for_signals, name='signal-watcher', daemon=True).start()
+    else:
+        def register(crawler):
+            crawler_ref.append(crawler)
+            for signum in signals:
+                signal.signal(signum, lambda signum, frame: handle(signum))
+        return register
 
-    # Signal crawler to stop
-    if hasattr(signal_handler, 'crawler'):
-        signal_handler.crawler.stop()
+    return crawler_ref.append
 
 
 def parse_arguments():
@@ -109,6 +131,11 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
 
+    # Imported after parsing so --help and argument errors return without
+    # loading the database driver, requests and BeautifulSoup
+    from database import DatabaseManager
+    from crawler import WebCrawler
+
     # Setup logging
     if args.verbose:
         Config.LOG_LEVEL = 'DEBUG'
@@ -129,6 +156,10 @@ def main():
         logger.error(f"Configuration error: {e}")
         sys.exit(1)
 
+    # Before the database pool or crawler start any threads, so they all
+    # inherit the blocked signal mask
+    register_crawler = watch_shutdown_signals()
+
     # Initialize database manager
     db_manager = None
     crawler = None
@@ -158,10 +189,8 @@ def main():
         logger.info("Initializing web crawler...")
         crawler = WebCrawler(db_manager)
 
-        # Register signal handlers for graceful shutdown
-        signal_handler.crawler = crawler
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Stop the crawler gracefully on SIGINT/SIGTERM from now on
+        register_crawler(crawler)
 
         # Run crawler in appropriate mode
         if args.domain:
@@ -11,24 +11,23 @@ Usage:
 """
 
 import os
+import hashlib
 import sys
 import re
 import argparse
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import List, Tuple, Optional
 
-# Try to import psycopg3 first, fall back to psycopg2
-try:
-    import psycopg
+from db_driver import driver as psycopg, PSYCOPG_VERSION
+
+if PSYCOPG_VERSION == 3:
     from psycopg import sql
-    PSYCOPG_VERSION = 3
-except ImportError:
-    import psycopg2 as psycopg
+else:
     from psycopg2 import sql
     from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-    PSYCOPG_VERSION = 2
 
 from config import Config
 
@@ -39,6 +38,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Migration filename handling
+_NUM_PREFIX_RE = re.compile(r'^(\d+)_')
+_STRIP_RE = re.compile(r'[^\w\s-]')
+_SPACE_RE = re.compile(r'[-\s]+')
+
 
 class MigrationManager:
     """Manages database migrations."""
@@ -51,6 +55,10 @@ class MigrationManager:
         self.conn = None
         self.migrations_dir = Path(self.MIGRATIONS_DIR)
 
+        # Directory listing and applied list, reused until they change
+        self._migration_files_cache = None
+        self._applied_cache = None
+
         # Validate migrations directory exists
         if not self.migrations_dir.exists():
             logger.error(f"Migrations directory '{self.MIGRATIONS_DIR}' not found")
@@ -60,12 +68,7 @@ class MigrationManager:
         """Connect to PostgreSQL database."""
         try:
             if PSYCOPG_VERSION == 3:
-                conninfo = (
-                    f"host={Config.DB_HOST} port={Config.DB_PORT} "
-                    f"dbname={Config.DB_NAME} user={Config.DB_USER} "
-                    f"password={Config.DB_PASSWORD}"
-                )
-                self.conn = psycopg.connect(conninfo, autocommit=True)
+                self.conn = psycopg.connect(Config.DSN, autocommit=True)
             else:
                 self.conn = psycopg.connect(
                     host=Config.DB_HOST,
@@ -89,6 +92,7 @@ class MigrationManager:
         """Create migrations tracking table if it doesn't exist."""
         try:
             with self.conn.cursor() as cur:
+                # Table and index in one round trip
                 cur.execute(f"""
                     CREATE TABLE IF NOT EXISTS {self.MIGRATIONS_TABLE} (
                         id SERIAL PRIMARY KEY,
@@ -96,13 +100,10 @@ class MigrationManager:
                         applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
                         execution_time_ms INTEGER,
                         checksum VARCHAR(64)
-                    )
-                """)
+                    );
 
-                # Create index
-                cur.execute(f"""
                     CREATE INDEX IF NOT EXISTS idx_{self.MIGRATIONS_TABLE}_migration
-                    ON {self.MIGRATIONS_TABLE}(migration)
+                    ON {self.MIGRATIONS_TABLE}(migration);
                 """)
 
                 self.conn.commit()
@@ -121,12 +122,15 @@ class MigrationManager:
         Returns:
             List of migration filenames
         """
-        migrations = []
-        for file in sorted(self.migrations_dir.glob('*.sql')):
-            # Exclude rollback files
-            if not file.name.endswith('_down.sql'):
-                migrations.append(file.name)
-        return migrations
+        if self._migration_files_cache is None:
+            # scandir yields bare names, with no Path built or glob matched
+            # per entry; rollback files are excluded
+            with os.scandir(self.migrations_dir) as entries:
+                self._migration_files_cache = sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith('.sql') and not entry.name.endswith('_down.sql')
+                )
+        return list(self._migration_files_cache)
 
     def get_applied_migrations(self) -> List[str]:
         """
@@ -135,6 +139,9 @@ class MigrationManager:
         Returns:
             List of applied migration names
         """
+        if self._applied_cache is not None:
+            return list(self._applied_cache)
+
         try:
             with self.conn.cursor() as cur:
                 cur.execute(f"""
@@ -142,7 +149,8 @@ class MigrationManager:
                     FROM {self.MIGRATIONS_TABLE}
                     ORDER BY migration
                 """)
-                return [row[0] for row in cur.fetchall()]
+                self._applied_cache = [row[0] for row in cur.fetchall()]
+                return list(self._applied_cache)
         except Exception as e:
             logger.error(f"Failed to get applied migrations: {e}")
             return []
@@ -155,7 +163,7 @@ class MigrationManager:
             List of pending migration filenames
         """
         all_migrations = self.get_migration_files()
-        applied = self.get_applied_migrations()
+        applied = set(self.get_applied_migrations())
         return [m for m in all_migrations if m not in applied]
 
     def read_migration_file(self, filename: str) -> str:
@@ -168,13 +176,25 @@ class MigrationManager:
         Returns:
             SQL content
         """
+        return self.read_migration(filename)[0]
+
+    def read_migration(self, filename: str) -> Tuple[str, str]:
+        """
+        Read migration file content and its checksum in one read.
+
+        Args:
+            filename: Migration filename
+
+        Returns:
+            Tuple of (SQL content, SHA-256 hex digest of the file bytes)
+        """
         filepath = self.migrations_dir / filename
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read()
+            data = filepath.read_bytes()
         except Exception as e:
             logger.error(f"Failed to read migration file {filename}: {e}")
             raise
+        return data.decode('utf-8'), hashlib.sha256(data).hexdigest()
 
     def apply_migration(self, migration_name: str) -> bool:
         """
@@ -187,35 +207,45 @@ class MigrationManager:
             True if successful, False otherwise
         """
         logger.info(f"Applying migration: {migration_name}")
+        self._applied_cache = None
 
         try:
-            # Read migration SQL
-            sql_content = self.read_migration_file(migration_name)
+            # Read migration SQL; the checksum is stored so later edits to
+            # an applied file can be spotted
+            sql_content, checksum = self.read_migration(migration_name)
 
             # Record start time
-            start_time = datetime.now()
-
-            # Execute migration
-            with self.conn.cursor() as cur:
-                # Execute the migration SQL
-                cur.execute(sql_content)
-
-            # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds() * 1000
+            start_ns = time.perf_counter_ns()
+
+            # Record migration as applied in the same round trip; the
+            # server times the migration statements that ran before it
+            record = sql.SQL("""
+                INSERT INTO {table}
+                (migration, execution_time_ms, checksum)
+                VALUES (
+                    {migration},
+                    (EXTRACT(EPOCH FROM clock_timestamp() - statement_timestamp()) * 1000)::integer,
+                    {checksum}
+                )
+            """).format(
+                table=sql.Identifier(self.MIGRATIONS_TABLE),
+                migration=sql.Literal(migration_name),
+                checksum=sql.Literal(checksum)
+            )
 
-            # Record migration as applied
+            # Execute migration and record it as one multi-statement query,
+            # which the server runs as a single transaction
             with self.conn.cursor() as cur:
-                cur.execute(f"""
-                    INSERT INTO {self.MIGRATIONS_TABLE}
-                    (migration, execution_time_ms)
-                    VALUES (%s, %s)
-                """, (migration_name, int(execution_time)))
+                cur.execute(sql.Composed([sql.SQL(sql_content), sql.SQL("\n;\n"), record]))
 
             self.conn.commit()
 
+            # Calculate execution time
+            execution_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+
             logger.info(
                 f"Migration {migration_name} applied successfully "
-                f"(took {execution_time:.0f}ms)"
+                f"(took {execution_time}ms)"
             )
             return True
 
@@ -235,34 +265,41 @@ class MigrationManager:
             True if successful, False otherwise
         """
         logger.warning(f"Rolling back migration: {migration_name}")
+        self._applied_cache = None
 
         try:
             # Check if rollback file exists
             rollback_file = migration_name.replace('.sql', '_down.sql')
             rollback_path = self.migrations_dir / rollback_file
+            has_rollback = rollback_path.exists()
 
-            if rollback_path.exists():
-                # Execute rollback SQL
-                sql_content = self.read_migration_file(rollback_file)
-
-                with self.conn.cursor() as cur:
-                    cur.execute(sql_content)
+            # Remove from migrations table
+            query = sql.SQL("""
+                DELETE FROM {table}
+                WHERE migration = {migration}
+            """).format(
+                table=sql.Identifier(self.MIGRATIONS_TABLE),
+                migration=sql.Literal(migration_name)
+            )
 
-                logger.info(f"Executed rollback script: {rollback_file}")
+            if has_rollback:
+                # Execute rollback SQL together with the DELETE, in one
+                # round trip and one transaction
+                sql_content = self.read_migration_file(rollback_file)
+                query = sql.Composed([sql.SQL(sql_content), sql.SQL("\n;\n"), query])
             else:
                 logger.warning(
                     f"No rollback script found for {migration_name}. "
                     "Skipping rollback execution."
                 )
 
-            # Remove from migrations table
             with self.conn.cursor() as cur:
-                cur.execute(f"""
-                    DELETE FROM {self.MIGRATIONS_TABLE}
-                    WHERE migration = %s
-                """, (migration_name,))
+                cur.execute(query)
 
             self.conn.commit()
+
+            if has_rollback:
+                logger.info(f"Executed rollback script: {rollback_file}")
             logger.info(f"Migration {migration_name} rolled back successfully")
             return True
 
@@ -331,43 +368,48 @@ class MigrationManager:
     def show_status(self) -> None:
         """Display migration status."""
         all_migrations = self.get_migration_files()
-        applied = self.get_applied_migrations()
-        pending = self.get_pending_migrations()
 
-        print("\n" + "=" * 70)
-        print("DATABASE MIGRATION STATUS")
-        print("=" * 70)
-
-        print(f"\nDatabase: {Config.DB_NAME}@{Config.DB_HOST}")
-        print(f"Total migrations: {len(all_migrations)}")
-        print(f"Applied: {len(applied)}")
-        print(f"Pending: {len(pending)}")
+        # Applied migrations and their details come from a single query
+        with self.conn.cursor() as cur:
+            cur.execute(f"""
+                SELECT migration, applied_at, execution_time_ms
+                FROM {self.MIGRATIONS_TABLE}
+                ORDER BY migration
+            """)
+            applied_rows = cur.fetchall()
+
+        applied = [row[0] for row in applied_rows]
+        self._applied_cache = applied
+        applied_set = set(applied)
+        pending = [m for m in all_migrations if m not in applied_set]
+
+        # Build the report and write it with a single print call
+        lines = [
+            "",
+            "=" * 70,
+            "DATABASE MIGRATION STATUS",
+            "=" * 70,
+            "",
+            f"Database: {Config.DB_NAME}@{Config.DB_HOST}",
+            f"Total migrations: {len(all_migrations)}",
+            f"Applied: {len(applied)}",
+            f"Pending: {len(pending)}",
+        ]
 
         if applied:
-            print("\n" + "-" * 70)
-            print("APPLIED MIGRATIONS:")
-            print("-" * 70)
+            lines += ["", "-" * 70, "APPLIED MIGRATIONS:", "-" * 70]
 
-            # Get detailed info from database
-            with self.conn.cursor() as cur:
-                cur.execute(f"""
-                    SELECT migration, applied_at, execution_time_ms
-                    FROM {self.MIGRATIONS_TABLE}
-                    ORDER BY migration
-                """)
-                for row in cur.fetchall():
-                    status = "✓"
-                    time_str = f"{row[2]}ms" if row[2] else "N/A"
-                    print(f"  {status} {row[0]:<40} (applied: {row[1]}, took: {time_str})")
+            for row in applied_rows:
+                status = "✓"
+                time_str = f"{row[2]}ms" if row[2] else "N/A"
+                lines.append(f"  {status} {row[0]:<40} (applied: {row[1]}, took: {time_str})")
 
         if pending:
-            print("\n" + "-" * 70)
-            print("PENDING MIGRATIONS:")
-            print("-" * 70)
-            for migration in pending:
-                print(f"  ○ {migration}")
+            lines += ["", "-" * 70, "PENDING MIGRATIONS:", "-" * 70]
+            lines.extend(f"  ○ {migration}" for migration in pending)
 
-        print("\n" + "=" * 70 + "\n")
+        lines += ["", "=" * 70, ""]
+        print("\n".join(lines))
 
     def reset(self) -> None:
         """Reset database by rolling back all migrations and re-running."""
@@ -401,7 +443,7 @@ class MigrationManager:
         if existing:
             # Extract number from last migration
             last = existing[-1]
-            match = re.match(r'^(\d+)_', last)
+            match = _NUM_PREFIX_RE.match(last)
             if match:
                 next_num = int(match.group(1)) + 1
             else:
@@ -413,8 +455,8 @@ class MigrationManager:
         num_str = f"{next_num:03d}"
 
         # Clean name (remove special chars, replace spaces with underscores)
-        clean_name = re.sub(r'[^\w\s-]', '', name)
-        clean_name = re.sub(r'[-\s]+', '_', clean_name)
+        clean_name = _STRIP_RE.sub('', name)
+        clean_name = _SPACE_RE.sub('_', clean_name)
 
         # Create filenames
         up_filename = f"{num_str}_{clean_name}.sql"
@@ -466,6 +508,8 @@ END $$;
             with open(down_path, 'w', encoding='utf-8') as f:
                 f.write(down_template)
 
+            self._migration_files_cache = None
+
             logger.info(f"Created migration files:")
             logger.info(f"  Up:   {up_filename}")
             logger.info(f"  Down: {down_filename}")
@@ -506,11 +550,10 @@ def main():
     manager = MigrationManager()
 
     try:
-        # Connect to database
-        manager.connect()
-
-        # Ensure migrations table exists (except for create command)
+        # Connect to database and ensure migrations table exists (except
+        # for create command, which only writes files)
         if args.command != 'create':
+            manager.connect()
             manager.ensure_migrations_table()
 
         # Execute command
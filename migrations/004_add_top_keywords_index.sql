@@ -0,0 +1,17 @@
+-- Migration: 004_add_top_keywords_index.sql
+-- Description: Add covering index for the top keywords report
+-- Date: 2026-10-15
+
+-- Covering index matching check_status.py's
+-- ORDER BY unique_domains_count DESC, total_occurrences DESC LIMIT n,
+-- so the report is served by an index-only scan instead of a top-N sort.
+-- Not created CONCURRENTLY: migrate.py runs each file as one multi-statement
+-- query, which executes inside an implicit transaction block.
+CREATE INDEX IF NOT EXISTS idx_keywords_master_top
+ON keywords_master(unique_domains_count DESC, total_occurrences DESC)
+INCLUDE (keyword, normalized_keyword);
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 004_add_top_keywords_index.sql completed successfully';
+END $$;
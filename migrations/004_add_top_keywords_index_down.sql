@@ -0,0 +1,10 @@
+-- Rollback: 004_add_top_keywords_index_down.sql
+-- Description: Rollback for add_top_keywords_index
+-- Date: 2026-10-15
+
+DROP INDEX IF EXISTS idx_keywords_master_top;
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Rollback 004_add_top_keywords_index_down.sql completed successfully';
+END $$;
@@ -0,0 +1,22 @@
+-- Migration: 005_add_pending_companies_index.sql
+-- Description: Add partial index for claiming pending companies
+-- Date: 2026-10-15
+
+-- Partial index matching the crawler's claim query
+-- WHERE crawl_status = 'pending' AND is_active = true ORDER BY created_at
+-- ... FOR UPDATE SKIP LOCKED, so each claim reads the oldest pending rows
+-- straight off the index instead of filtering and sorting the table.
+-- It only holds pending rows, so it stays small as domains complete.
+-- The ON CONFLICT targets used by the keyword UPSERTs are already backed by
+-- the unique constraints keywords_master_normalized_unique and
+-- domain_keywords_unique_combination from 001, so no index is added for them.
+-- Not created CONCURRENTLY: migrate.py runs each file as one multi-statement
+-- query, which executes inside an implicit transaction block.
+CREATE INDEX IF NOT EXISTS idx_companies_pending
+ON companies(created_at)
+WHERE crawl_status = 'pending' AND is_active = true;
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 005_add_pending_companies_index.sql completed successfully';
+END $$;
@@ -0,0 +1,10 @@
+-- Rollback: 005_add_pending_companies_index_down.sql
+-- Description: Rollback for add_pending_companies_index
+-- Date: 2026-10-15
+
+DROP INDEX IF EXISTS idx_companies_pending;
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Rollback 005_add_pending_companies_index_down.sql completed successfully';
+END $$;
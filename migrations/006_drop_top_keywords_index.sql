@@ -0,0 +1,16 @@
+-- Migration: 006_drop_top_keywords_index.sql
+-- Description: Drop the covering index for the top keywords report
+-- Date: 2026-10-15
+
+-- idx_keywords_master_top (004) is keyed on unique_domains_count and
+-- total_occurrences, which the crawler increments for every stored page.
+-- Every statistics update therefore had to write the index and could not
+-- be a HOT update, bloating the index on the hottest write path. The top-N
+-- sort over keywords_master it saved check_status.py is cheap, so the
+-- index is dropped.
+DROP INDEX IF EXISTS idx_keywords_master_top;
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 006_drop_top_keywords_index.sql completed successfully';
+END $$;
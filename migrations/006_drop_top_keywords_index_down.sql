@@ -0,0 +1,12 @@
+-- Rollback: 006_drop_top_keywords_index_down.sql
+-- Description: Rollback for drop_top_keywords_index
+-- Date: 2026-10-15
+
+CREATE INDEX IF NOT EXISTS idx_keywords_master_top
+ON keywords_master(unique_domains_count DESC, total_occurrences DESC)
+INCLUDE (keyword, normalized_keyword);
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Rollback 006_drop_top_keywords_index_down.sql completed successfully';
+END $$;
@@ -3,9 +3,11 @@ HTML parser for extracting navigation menu items from websites.
 """
 
 import logging
-from typing import List, Set
+from typing import List, Optional, Set
+from urllib.parse import urljoin, urlparse
+import soupsieve
 from bs4 import BeautifulSoup, Tag
-from utils import extract_keywords_from_text, sanitize_text, KeywordFilter
+from utils import HTML_PARSER, extract_keywords_from_text, sanitize_text, KeywordFilter
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,10 @@ class MenuParser:
         '.nav-container',
     ]
 
+    # All of NAV_SELECTORS compiled once into a single selector, so each page
+    # is walked once instead of once per selector
+    NAV_SELECTOR = soupsieve.compile(', '.join(NAV_SELECTORS))
+
     # Attributes that might indicate navigation
     NAV_ATTRIBUTES = [
         {'role': 'navigation'},
@@ -58,7 +64,6 @@ class MenuParser:
 
     def __init__(self):
         """Initialize the menu parser."""
-        self.soup = None
         # Initialize keyword filter based on configuration
         if Config.ENABLE_KEYWORD_FILTER:
             self.keyword_filter = KeywordFilter(Config.KEYWORD_EXCLUSIONS_FILE)
@@ -67,12 +72,13 @@ class MenuParser:
             self.keyword_filter = None
             logger.info("Keyword filtering disabled")
 
-    def parse(self, html_content: str) -> List[str]:
+    def parse(self, html_content: str, soup: Optional[BeautifulSoup] = None) -> List[str]:
         """
         Parse HTML content and extract menu items.
 
         Args:
             html_content: Raw HTML content
+            soup: Already parsed document for html_content, to skip re-parsing
 
         Returns:
             List of menu item texts
@@ -81,33 +87,37 @@ class MenuParser:
             return []
 
         try:
-            self.soup = BeautifulSoup(html_content, 'html.parser')
-            menu_items = self._extract_menu_items()
+            if soup is None:
+                soup = BeautifulSoup(html_content, HTML_PARSER)
+            menu_items = self._extract_menu_items(soup)
             return menu_items
         except Exception as e:
             logger.error(f"Error parsing HTML: {e}")
             return []
 
-    def _extract_menu_items(self) -> List[str]:
+    def _extract_menu_items(self, soup: BeautifulSoup) -> List[str]:
         """
         Extract menu items using multiple detection methods.
 
+        Args:
+            soup: Parsed HTML document
+
         Returns:
             List of unique menu item texts
         """
         all_items = set()
 
         # Method 1: CSS selectors
-        all_items.update(self._find_by_css_selectors())
+        all_items.update(self._find_by_css_selectors(soup))
 
         # Method 2: HTML5 semantic tags
-        all_items.update(self._find_by_semantic_tags())
+        all_items.update(self._find_by_semantic_tags(soup))
 
         # Method 3: ARIA attributes
-        all_items.update(self._find_by_aria_attributes())
+        all_items.update(self._find_by_aria_attributes(soup))
 
         # Method 4: Common patterns
-        all_items.update(self._find_by_common_patterns())
+        all_items.update(self._find_by_common_patterns(soup))
 
         # Filter and clean
         cleaned_items = self._clean_menu_items(all_items)
@@ -115,50 +125,54 @@ class MenuParser:
         logger.debug(f"Extracted {len(cleaned_items)} unique menu items")
         return list(cleaned_items)
 
-    def _find_by_css_selectors(self) -> Set[str]:
+    def _find_by_css_selectors(self, soup: BeautifulSoup) -> Set[str]:
         """
         Find menu items using CSS selectors.
 
+        Args:
+            soup: Parsed HTML document
+
         Returns:
             Set of menu item texts
         """
         items = set()
 
-        for selector in self.NAV_SELECTORS:
-            try:
-                elements = self.soup.select(selector)
-                for element in elements:
-                    items.update(self._extract_text_from_element(element))
-            except Exception as e:
-                logger.debug(f"Error with selector '{selector}': {e}")
+        for element in self.NAV_SELECTOR.select(soup):
+            items.update(self._extract_text_from_element(element))
 
         return items
 
-    def _find_by_semantic_tags(self) -> Set[str]:
+    def _find_by_semantic_tags(self, soup: BeautifulSoup) -> Set[str]:
         """
         Find menu items using HTML5 semantic tags.
 
+        Args:
+            soup: Parsed HTML document
+
         Returns:
             Set of menu item texts
         """
         items = set()
 
         # Find <nav> tags
-        nav_tags = self.soup.find_all('nav')
+        nav_tags = soup.find_all('nav')
         for nav in nav_tags:
             items.update(self._extract_text_from_element(nav))
 
         # Find <menu> tags
-        menu_tags = self.soup.find_all('menu')
+        menu_tags = soup.find_all('menu')
         for menu in menu_tags:
             items.update(self._extract_text_from_element(menu))
 
         return items
 
-    def _find_by_aria_attributes(self) -> Set[str]:
+    def _find_by_aria_attributes(self, soup: BeautifulSoup) -> Set[str]:
         """
         Find menu items using ARIA attributes.
 
+        Args:
+            soup: Parsed HTML document
+
         Returns:
             Set of menu item texts
         """
@@ -166,7 +180,7 @@ class MenuParser:
 
         for attrs in self.NAV_ATTRIBUTES:
             try:
-                elements = self.soup.find_all(attrs=attrs)
+                elements = soup.find_all(attrs=attrs)
                 for element in elements:
                     items.update(self._extract_text_from_element(element))
             except Exception as e:
@@ -174,17 +188,20 @@ class MenuParser:
 
         return items
 
-    def _find_by_common_patterns(self) -> Set[str]:
+    def _find_by_common_patterns(self, soup: BeautifulSoup) -> Set[str]:
         """
         Find menu items using common class/id patterns.
 
+        Args:
+            soup: Parsed HTML document
+
         Returns:
             Set of menu item texts
         """
         items = set()
 
         # Find all divs and other containers
-        containers = self.soup.find_all(['div', 'ul', 'ol', 'aside', 'section'])
+        containers = soup.find_all(['div', 'ul', 'ol', 'aside', 'section'])
 
         for container in containers:
             # Check class and id attributes
@@ -311,7 +328,7 @@ class MenuParser:
 
         return cleaned
 
-    def extract_keywords(self, html_content: str) -> Set[str]:
+    def extract_keywords(self, html_content: str, soup: Optional[BeautifulSoup] = None) -> Set[str]:
         """
         Extract, normalize, and filter keywords from menu items.
 
@@ -320,11 +337,12 @@ class MenuParser:
 
         Args:
             html_content: Raw HTML content
+            soup: Already parsed document for html_content, to skip re-parsing
 
         Returns:
             Set of filtered, normalized keywords (business-focused)
         """
-        menu_items = self.parse(html_content)
+        menu_items = self.parse(html_content, soup=soup)
 
         all_keywords = set()
         for item in menu_items:
@@ -346,7 +364,7 @@ class MenuParser:
             logger.debug("Keyword filtering disabled, returning all keywords")
             return all_keywords
 
-    def extract_homepage_headers(self, html_content: str) -> Set[str]:
+    def extract_homepage_headers(self, html_content: str, soup: Optional[BeautifulSoup] = None) -> Set[str]:
         """
         Extract all header tags (H1-H6) and styled header-like text from homepage.
 
@@ -357,6 +375,7 @@ class MenuParser:
 
         Args:
             html_content: Raw HTML content
+            soup: Already parsed document for html_content, to skip re-parsing
 
         Returns:
             Set of header text content
@@ -365,7 +384,8 @@ class MenuParser:
             return set()
 
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if soup is None:
+                soup = BeautifulSoup(html_content, HTML_PARSER)
             headers = set()
 
             # Method 1: Extract all traditional header tags H1-H6
@@ -520,11 +540,11 @@ class MenuParser:
             return {'menus_found': 0, 'total_items': 0, 'items': []}
 
         try:
-            self.soup = BeautifulSoup(html_content, 'html.parser')
-            menu_items = self._extract_menu_items()
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            menu_items = self._extract_menu_items(soup)
 
             return {
-                'menus_found': len(self.soup.find_all('nav')) + len(self.soup.find_all('menu')),
+                'menus_found': len(soup.find_all('nav')) + len(soup.find_all('menu')),
                 'total_items': len(menu_items),
                 'items': menu_items[:50]  # Return first 50 items
             }
@@ -532,13 +552,19 @@ class MenuParser:
             logger.error(f"Error getting menu structure: {e}")
             return {'menus_found': 0, 'total_items': 0, 'items': []}
 
-    def extract_menu_links(self, html_content: str, base_url: str) -> Set[str]:
+    def extract_menu_links(
+        self,
+        html_content: str,
+        base_url: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> Set[str]:
         """
         Extract all navigation menu link URLs.
 
         Args:
             html_content: Raw HTML content
             base_url: Base URL to resolve relative links
+            soup: Already parsed document for html_content, to skip re-parsing
 
         Returns:
             Set of absolute menu link URLs
@@ -547,19 +573,15 @@ class MenuParser:
             return set()
 
         try:
-            from urllib.parse import urljoin, urlparse
-            soup = BeautifulSoup(html_content, 'html.parser')
+            if soup is None:
+                soup = BeautifulSoup(html_content, HTML_PARSER)
             menu_urls = set()
 
             # Find navigation elements using same selectors as menu extraction
             nav_elements = []
 
             # Method 1: CSS selectors
-            for selector in self.NAV_SELECTORS:
-                try:
-                    nav_elements.extend(soup.select(selector))
-                except Exception:
-                    continue
+            nav_elements.extend(self.NAV_SELECTOR.select(soup))
 
             # Method 2: Semantic tags
             nav_elements.extend(soup.find_all('nav'))
@@ -573,6 +595,7 @@ class MenuParser:
                     continue
 
             # Extract URLs from all navigation elements
+            base_domain = urlparse(base_url).netloc
             for nav_element in nav_elements:
                 links = nav_element.find_all('a', href=True)
                 for link in links:
@@ -586,10 +609,7 @@ class MenuParser:
                     absolute_url = urljoin(base_url, href)
 
                     # Only include URLs from the same domain
-                    base_domain = urlparse(base_url).netloc
-                    link_domain = urlparse(absolute_url).netloc
-
-                    if base_domain == link_domain:
+                    if urlparse(absolute_url).netloc == base_domain:
                         # Remove fragments
                         absolute_url = absolute_url.split('#')[0]
                         menu_urls.add(absolute_url)
@@ -9,12 +9,21 @@ import logging
 import re
 import json
 from typing import List, Dict, Tuple, Optional, Set
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 from bs4 import BeautifulSoup, Tag
-from utils import sanitize_text
+from utils import HTML_PARSER, sanitize_text
 
 logger = logging.getLogger(__name__)
 
+# Navigation/content containers searched for offering links
+_NAV_CLASS_RE = re.compile('nav|menu|content|main|services|products|solutions')
+
+# Listing (hub) page paths, singular and plural, with optional trailing slash
+_LISTING_URL_RE = re.compile(
+    r'/(?:services?|solutions?|products?|offerings?|what-we-do|platforms'
+    r'|technologies|portfolio|practice-areas|practices?)/?$'
+)
+
 
 class NavigationLinkFollower:
     """Identifies business offering links from website navigation (industry-agnostic)."""
@@ -122,22 +131,8 @@ class NavigationLinkFollower:
 
         # Listing pages (hub pages with multiple offerings)
         # Include both singular and plural forms
-        listing_indicators = [
-            '/services$', '/services/$', '/service$', '/service/$',
-            '/solutions$', '/solutions/$', '/solution$', '/solution/$',
-            '/products$', '/products/$', '/product$', '/product/$',
-            '/offerings$', '/offerings/$', '/offering$', '/offering/$',
-            '/what-we-do$', '/what-we-do/$',
-            '/platforms$', '/platforms/$',
-            '/technologies$', '/technologies/$',
-            '/portfolio$', '/portfolio/$',
-            '/practice-areas$', '/practice-areas/$',
-            '/practices$', '/practices/$', '/practice$', '/practice/$',
-        ]
-
-        for indicator in listing_indicators:
-            if re.search(indicator, path):
-                return 'service_listing'
+        if _LISTING_URL_RE.search(path):
+            return 'service_listing'
 
         # Detail pages (specific offering pages)
         # Examples: /services/consulting, /products/crm-software, /platforms/analytics
@@ -161,7 +156,12 @@ class NavigationLinkFollower:
         return NavigationLinkFollower.classify_offering_url(url)
 
     @staticmethod
-    def find_service_links(html_content: str, base_url: str, max_links: int = 50) -> List[Dict[str, str]]:
+    def find_service_links(
+        html_content: str,
+        base_url: str,
+        max_links: int = 50,
+        soup: Optional[BeautifulSoup] = None
+    ) -> List[Dict[str, str]]:
         """
         Find offering-related links from navigation menu (industry-agnostic).
 
@@ -169,39 +169,49 @@ class NavigationLinkFollower:
             html_content: Homepage HTML content
             base_url: Base URL for resolving relative links
             max_links: Maximum number of offering links to return (increased to 50)
+            soup: Already parsed document for html_content, to skip re-parsing
 
         Returns:
             List of dicts with 'url' and 'type' ('service_listing' or 'service_detail')
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(html_content, HTML_PARSER)
         offering_links = []
         seen_urls = set()
 
         # Find all links in navigation areas AND main content
         # Include main content to capture offering links not in nav
         nav_areas = (soup.find_all(['nav', 'header', 'main', 'article']) +
-                     soup.find_all(class_=re.compile('nav|menu|content|main|services|products|solutions')))
+                     soup.find_all(class_=_NAV_CLASS_RE))
+
+        base_netloc = urlparse(base_url).netloc.lower()
 
         for area in nav_areas:
             for link in area.find_all('a', href=True):
                 href = link['href']
                 absolute_url = urljoin(base_url, href)
 
-                # Only same-domain URLs
-                if urlparse(absolute_url).netloc != urlparse(base_url).netloc:
-                    continue
-
                 # Remove fragments and queries for deduplication
-                clean_url = absolute_url.split('#')[0].split('?')[0]
+                parsed = urlsplit(absolute_url.split('#')[0].split('?')[0])
+
+                # Only same-domain URLs (host names are case-insensitive)
+                netloc = parsed.netloc.lower()
+                if netloc != base_netloc:
+                    continue
 
                 # Normalize trailing slashes for deduplication
                 # Remove trailing slash unless it's the root path
-                if clean_url.endswith('/') and len(urlparse(clean_url).path) > 1:
-                    clean_url = clean_url.rstrip('/')
+                path = parsed.path
+                if path.endswith('/') and len(path) > 1:
+                    path = path.rstrip('/')
+
+                # Lowercase scheme and host so case variants of one page collapse
+                clean_url = f"{parsed.scheme.lower()}://{netloc}{path}"
 
-                # Skip if already seen
+                # Skip if already seen (offering or not, the answer won't change)
                 if clean_url in seen_urls:
                     continue
+                seen_urls.add(clean_url)
 
                 # Check if offering URL
                 if NavigationLinkFollower.is_offering_url(clean_url):
@@ -212,7 +222,6 @@ class NavigationLinkFollower:
                             'type': url_type,
                             'link_text': link.get_text(strip=True)
                         })
-                        seen_urls.add(clean_url)
 
                         if len(offering_links) >= max_links:
                             break
@@ -1112,7 +1121,7 @@ class ServicePageExtractor:
         Returns:
             Dict of {keyword: {'confidence': float, 'method': str, 'url': str}}
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         all_keywords = {}
 
         # Extract from multiple sources (expanded extraction)
@@ -1257,7 +1266,7 @@ class ServiceListingExtractor:
         Returns:
             Dict of {keyword: {'confidence': float, 'method': str, 'url': str}}
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         all_keywords = {}
 
         # Extract from offering cards (expanded patterns)
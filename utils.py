@@ -6,8 +6,11 @@ import re
 import time
 import random
 import logging
+import threading
 import yaml
 from pathlib import Path
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional, Set, List, Dict
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
@@ -15,6 +18,13 @@ from fnmatch import fnmatch
 
 logger = logging.getLogger(__name__)
 
+# BeautifulSoup tree builder: lxml (C) when installed, else the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 
 # Special character replacements for normalization
 SPECIAL_CHAR_REPLACEMENTS = {
@@ -25,6 +35,12 @@ SPECIAL_CHAR_REPLACEMENTS = {
     '#': ' number ',
     '%': ' percent ',
 }
+_SPECIAL_CHAR_TABLE = str.maketrans(SPECIAL_CHAR_REPLACEMENTS)
+
+# Patterns used by normalize_keyword, compiled once
+_NON_KEYWORD_CHARS_RE = re.compile(r'[^\w\s\-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HYPHENS_RE = re.compile(r'-+')
 
 
 def normalize_keyword(keyword: str) -> str:
@@ -52,21 +68,18 @@ def normalize_keyword(keyword: str) -> str:
     if not keyword:
         return ""
 
-    # Convert to lowercase
-    normalized = keyword.lower()
-
-    # Replace special characters with text equivalents
-    for char, replacement in SPECIAL_CHAR_REPLACEMENTS.items():
-        normalized = normalized.replace(char, replacement)
+    # Convert to lowercase and replace special characters with text
+    # equivalents in a single pass
+    normalized = keyword.lower().translate(_SPECIAL_CHAR_TABLE)
 
     # Remove remaining special characters but keep spaces, hyphens, and underscores
-    normalized = re.sub(r'[^\w\s\-]', '', normalized)
+    normalized = _NON_KEYWORD_CHARS_RE.sub('', normalized)
 
     # Replace multiple spaces with single space
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
 
     # Replace multiple hyphens with single hyphen
-    normalized = re.sub(r'-+', '-', normalized)
+    normalized = _HYPHENS_RE.sub('-', normalized)
 
     # Trim whitespace and hyphens
     normalized = normalized.strip().strip('-')
@@ -130,6 +143,32 @@ def rate_limit_delay(min_delay: float = 1.0, max_delay: float = 2.0) -> None:
     time.sleep(delay)
 
 
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Parse a Retry-After header into a delay.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (0 if the date has passed), or None if unparseable
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def is_valid_url(url: str) -> bool:
     """
     Check if a URL is valid.
@@ -147,16 +186,27 @@ def is_valid_url(url: str) -> bool:
         return False
 
 
-def check_robots_txt(url: str, user_agent: str) -> bool:
+def fetch_robots_parser(
+    url: str,
+    session=None,
+    timeout: float = 10,
+    verify: bool = True
+) -> Optional[RobotFileParser]:
     """
-    Check if crawling is allowed by robots.txt.
+    Fetch and parse robots.txt for the host of a URL.
+
+    A parser whose mtime() is 0 holds a transient answer (the server returned
+    a 5xx, so nothing is allowed for now) and should not be kept for long.
 
     Args:
-        url: URL to check
-        user_agent: User agent string
+        url: Any URL on the host
+        session: Optional requests session, so the fetch reuses its pooled
+            keep-alive connections; urllib is used when not given
+        timeout: Request timeout in seconds when fetching through the session
+        verify: Whether to verify TLS certificates when fetching through the session
 
     Returns:
-        True if allowed, False if disallowed
+        Parsed robots.txt, or None if it could not be read
     """
     try:
         parsed = urlparse(url)
@@ -164,13 +214,27 @@ def check_robots_txt(url: str, user_agent: str) -> bool:
 
         rp = RobotFileParser()
         rp.set_url(robots_url)
-        rp.read()
 
-        return rp.can_fetch(user_agent, url)
+        if session is None:
+            rp.read()
+            return rp
+
+        # Same status handling as RobotFileParser.read(): 401/403 disallow
+        # everything, other 4xx allow everything, 5xx leave nothing allowed
+        response = session.get(robots_url, timeout=timeout, verify=verify)
+        if response.status_code in (401, 403):
+            rp.disallow_all = True
+            rp.modified()
+        elif 400 <= response.status_code < 500:
+            rp.allow_all = True
+            rp.modified()
+        elif response.status_code < 400:
+            rp.parse(response.content.decode('utf-8', errors='replace').splitlines())
+
+        return rp
     except Exception as e:
         logger.warning(f"Error checking robots.txt for {url}: {e}")
-        # If we can't read robots.txt, allow crawling
-        return True
+        return None
 
 
 def extract_keywords_from_text(text: str, min_length: int = 2) -> Set[str]:
@@ -288,32 +352,89 @@ def get_domain_from_url(url: str) -> Optional[str]:
         return None
 
 
-class RateLimiter:
-    """Simple rate limiter to control request frequency."""
+class PerHostRateLimiter:
+    """
+    Rate limiter that spaces out requests to the same host only.
+
+    Each host gets its own schedule, so workers crawling different hosts
+    never wait on each other while requests to one host stay at least
+    min_delay..max_delay seconds apart. example.com and www.example.com
+    share one schedule, since sites commonly redirect from one to the other.
+    """
+
+    # Forget idle hosts once the schedule grows past this many entries
+    PRUNE_THRESHOLD = 1024
+
+    # Longest a host's Retry-After may hold back its next request, in seconds
+    MAX_DEFER = 120.0
 
     def __init__(self, min_delay: float = 1.0, max_delay: float = 2.0):
         """
         Initialize rate limiter.
 
         Args:
-            min_delay: Minimum delay between requests in seconds
-            max_delay: Maximum delay between requests in seconds
+            min_delay: Minimum delay between requests to a host in seconds
+            max_delay: Maximum delay between requests to a host in seconds
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.last_request_time = 0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
 
-    def wait(self) -> None:
-        """Wait for rate limit before next request."""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+    @staticmethod
+    def _host_key(netloc: str) -> str:
+        """
+        Schedule key for a host, so www. and bare forms of a host match.
 
-        delay = random.uniform(self.min_delay, self.max_delay)
+        Args:
+            netloc: Host (network location)
 
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
+        Returns:
+            Lowercased host without a leading www.
+        """
+        netloc = netloc.lower()
+        return netloc[4:] if netloc.startswith('www.') else netloc
 
-        self.last_request_time = time.time()
+    def wait(self, netloc: str) -> None:
+        """
+        Wait for rate limit before the next request to a host.
+
+        Args:
+            netloc: Host (network location) the request goes to
+        """
+        netloc = self._host_key(netloc)
+        with self._lock:
+            now = time.time()
+            last = self._next_slot.get(netloc)
+
+            # Reserve the next free slot for this host, then sleep outside the lock
+            if last is None:
+                slot = now
+            else:
+                slot = max(now, last + random.uniform(self.min_delay, self.max_delay))
+            self._next_slot[netloc] = slot
+
+            if len(self._next_slot) > self.PRUNE_THRESHOLD:
+                cutoff = now - self.max_delay
+                self._next_slot = {
+                    host: t for host, t in self._next_slot.items() if t >= cutoff
+                }
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def defer(self, netloc: str, delay: float) -> None:
+        """
+        Hold back the next request to a host, e.g. after a 429 with Retry-After.
+
+        Args:
+            netloc: Host (network location) to back off from
+            delay: Seconds to wait, capped at MAX_DEFER
+        """
+        netloc = self._host_key(netloc)
+        with self._lock:
+            until = time.time() + min(delay, self.MAX_DEFER)
+            self._next_slot[netloc] = max(self._next_slot.get(netloc, until), until)
 
 
 class ProgressTracker: